@@ -11,17 +11,16 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
-import json
-import glob
+import orjson
+import msgspec
 import uvicorn
 import asyncio
 import threading
-import queue
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse 
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 # --- IMPORTS (MATCHING YOUR FOLDER STRUCTURE) ---
 try:
@@ -36,7 +35,8 @@ except ModuleNotFoundError as e:
     print("   Please verify that 'src/orchestration/pipeline.py' exists.\n")
     raise e
 
-app = FastAPI(title="AutoLabor Compliance API")
+# orjson handles both decoding of the stored reports and encoding of responses
+app = FastAPI(title="AutoLabor Compliance API", default_response_class=ORJSONResponse)
 
 # --- CORS CONFIG (Railway / Frontend Friendly) ---
 # If you know your exact frontend URL(s), set FRONTEND_ORIGINS env var:
@@ -54,20 +54,20 @@ else:
     cors_allow_credentials = True
 
 # Allow Frontend access (including preflight OPTIONS)
+# Only the methods/headers the frontend actually uses; browsers cache the
+# preflight for a day so JSON POSTs (e.g. /api/compare) skip the extra OPTIONS round-trip.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_allow_origins,
     allow_credentials=cors_allow_credentials,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
-# --- GLOBAL QUEUE FOR REAL-TIME UPDATES ---
-msg_queue = queue.Queue()
-
-def pipeline_callback(data):
-    """Bridge function to put pipeline updates into the queue"""
-    msg_queue.put(data)
+# --- REAL-TIME UPDATES ---
+# Max updates packed into a single WebSocket frame
+WS_BATCH_LIMIT = 128
 
 class AuditRequest(BaseModel):
     company_name: str
@@ -75,10 +75,34 @@ class AuditRequest(BaseModel):
 class CompareRequest(BaseModel):
     companies: List[str]
 
+class ReportFileResponse(FileResponse):
+    """FileResponse that streams consolidated PDFs in 1 MB chunks (Starlette default is 64 KB)"""
+    chunk_size = 1 << 20
+
 # Define paths relative to BASE_DIR to avoid "file not found" errors
 DATA_DIR = os.path.join(BASE_DIR, "data", "03_structured")
 RAW_DIR = os.path.join(BASE_DIR, "data", "01_raw")
 
+# Precomputed once so request handlers build report paths with a plain f-string
+_DATA_PREFIX = DATA_DIR + os.sep
+_SUFFIX_JSON = "_Consolidated_Report.json"
+_SUFFIX_PDF = "_Consolidated_Report.pdf"
+
+def _read_bytes(path):
+    """Returns the raw bytes of a report for orjson/msgspec (no text decode step)."""
+    with open(path, "rb") as fh:
+        return fh.read()
+
+def _iter_reports(suffix):
+    """
+    Yields DirEntry objects in DATA_DIR whose name ends with `suffix`.
+    A single scandir pass: no fnmatch and no extra stat per entry (unlike glob).
+    """
+    with os.scandir(DATA_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield entry
+
 @app.get("/")
 def health_check():
     return {"status": "System Online", "module": "SANE-AI Auditor"}
@@ -87,6 +111,16 @@ def health_check():
 @app.websocket("/ws/audit")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
+
+    # Per-connection queue: concurrent audits never see each other's updates.
+    # asyncio.Queue lets the handler await updates instead of polling; the worker
+    # thread hands items over via call_soon_threadsafe on this loop.
+    msg_queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+
+    def pipeline_callback(data):
+        """Bridge function to put pipeline updates into this connection's queue (thread-safe)"""
+        loop.call_soon_threadsafe(msg_queue.put_nowait, data)
     
     audit_thread = None
     
@@ -99,6 +133,10 @@ async def websocket_endpoint(websocket: WebSocket):
         # 2. Define the job wrapper
         def run_job():
             try:
+                # First frame goes out before the (slow) orchestrator/model init, so the
+                # dashboard shows progress immediately instead of waiting on construction
+                pipeline_callback({"status": "processing", "message": "⚙️ Booting audit engine...", "progress": 1})
+
                 # Initialize Orchestrator
                 orchestrator = ComplianceOrchestrator()
                 
@@ -106,8 +144,9 @@ async def websocket_endpoint(websocket: WebSocket):
                 os.makedirs(RAW_DIR, exist_ok=True)
                 os.makedirs(DATA_DIR, exist_ok=True)
                 
-                # Run the pipeline with the callback
-                orchestrator.run_pipeline(
+                # Run the pipeline with the callback.
+                # It returns the saved report dict, so no disk round-trip is needed.
+                report_payload = orchestrator.run_pipeline(
                     target_company=company_name, 
                     specific_files=None,
                     progress_callback=pipeline_callback 
@@ -115,25 +154,22 @@ async def websocket_endpoint(websocket: WebSocket):
                 
                 # --- LOAD DATA IMMEDIATELY ---
                 # This fixes the "Audit Failed" race condition by sending data with the completion signal
-                safe_name = company_name.replace(" ", "_")
-                json_path = os.path.join(DATA_DIR, f"{safe_name}_Consolidated_Report.json")
-                report_payload = None
-                
-                # Robust load: If strict filename fails, check for fuzzy matches created by pipeline
-                if not os.path.exists(json_path):
-                    # Try finding any file that starts with the same first word (e.g. "Tata" for "Tata Motors")
-                    # This handles cases where pipeline saved as "Tata_Motors_Ltd" but API looks for "Tata_Motors"
-                    clean_start = safe_name.split("_")[0]
-                    candidates = glob.glob(os.path.join(DATA_DIR, f"*{clean_start}*_Consolidated_Report.json"))
-                    if candidates:
-                        json_path = candidates[0]
-
-                if os.path.exists(json_path):
-                    with open(json_path, "r", encoding="utf-8") as f:
-                        report_payload = json.load(f)
+                if report_payload is None:
+                    safe_name = company_name.replace(" ", "_")
+                    try:
+                        report_payload = orjson.loads(_read_bytes(f"{_DATA_PREFIX}{safe_name}{_SUFFIX_JSON}"))
+                    except FileNotFoundError:
+                        # Robust load: If strict filename fails, check for fuzzy matches created by pipeline
+                        # Try finding any file that starts with the same first word (e.g. "Tata" for "Tata Motors")
+                        # This handles cases where pipeline saved as "Tata_Motors_Ltd" but API looks for "Tata_Motors"
+                        clean_start = safe_name.split("_")[0]
+                        for entry in _iter_reports(_SUFFIX_JSON):
+                            if clean_start in entry.name:
+                                report_payload = orjson.loads(_read_bytes(entry.path))
+                                break
 
                 # Signal completion WITH DATA
-                msg_queue.put({
+                pipeline_callback({
                     "status": "completed", 
                     "progress": 100, 
                     "message": "Audit Finalized.",
@@ -142,7 +178,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 
             except Exception as e:
                 print(f"❌ Thread Error: {e}")
-                msg_queue.put({"status": "error", "message": str(e)})
+                pipeline_callback({"status": "error", "message": str(e)})
 
         # 3. Start the thread
         audit_thread = threading.Thread(target=run_job, daemon=True)
@@ -151,19 +187,18 @@ async def websocket_endpoint(websocket: WebSocket):
         # 4. Listen to Queue and Broadcast to Frontend
         while True:
             try:
-                # Use get_nowait to keep the loop responsive
-                while not msg_queue.empty():
-                    msg = msg_queue.get_nowait()
-                    await websocket.send_json(msg)
-                    
-                    if msg.get("status") in ["completed", "error"]:
-                        return # Exit cleanly
-                
-                # Yield control to allow async tasks to run
-                await asyncio.sleep(0.1)
+                # Sleep until the worker pushes an update (no polling delay)
+                batch = [await msg_queue.get()]
+
+                # Drain every other ready update into ONE frame (JSON array) instead of one send per message
+                while len(batch) < WS_BATCH_LIMIT and not msg_queue.empty():
+                    batch.append(msg_queue.get_nowait())
+
+                await websocket.send_text(orjson.dumps(batch).decode())
+
+                if any(msg.get("status") in ["completed", "error"] for msg in batch):
+                    return # Exit cleanly
                 
-            except queue.Empty:
-                await asyncio.sleep(0.1)
             except Exception as e:
                 print(f"❌ Queue Error: {e}")
                 break
@@ -180,41 +215,185 @@ async def websocket_endpoint(websocket: WebSocket):
 
 # --- REST Endpoints ---
 
+def _locate_report_pdf(company):
+    """Blocking part of /api/download_report: resolves the PDF path, filename and stat"""
+    clean_company = company.strip().rstrip('.')
+
+    # Prebuilt index first: normalize like list_reports, then a single dict lookup
+    for pdf_path in _load_report_index()["pdf_by_norm_key"].get(_normalize_company(clean_company), ()):
+        try:
+            return pdf_path, os.path.basename(pdf_path), os.stat(pdf_path)
+        except FileNotFoundError:
+            continue # JSON exists but its PDF sibling was never generated
+
+    safe_name = clean_company.replace(" ", "_")
+    filename = f"{safe_name}{_SUFFIX_PDF}"
+    file_path = f"{_DATA_PREFIX}{filename}"
+
+    # Exact filename: the stat doubles as the existence check
+    try:
+        return file_path, filename, os.stat(file_path)
+    except FileNotFoundError:
+        pass
+
+    # Fuzzy Fallback (single directory pass)
+    first_word = safe_name.split("_")[0]
+    company_lower = clean_company.lower()
+    first_word_match = None
+    partial_match = None
+
+    for entry in _iter_reports(_SUFFIX_PDF):
+        # A. Filename contains the first word of the request (e.g. "Tata" for "Tata Motors")
+        if first_word in entry.name:
+            first_word_match = entry
+            break
+        # B. Company name is inside the filename (case insensitive)
+        if partial_match is None and company_lower in entry.name.lower().replace("_", " "):
+            partial_match = entry
+
+    match = first_word_match or partial_match
+    if not match:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    return match.path, match.name, match.stat()
+
 @app.get("/api/download_report")
 async def download_report(company: str):
     try:
-        clean_company = company.strip().rstrip('.')
-        safe_name = clean_company.replace(" ", "_")
-        filename = f"{safe_name}_Consolidated_Report.pdf"
-        file_path = os.path.join(DATA_DIR, filename)
-
-        # Fuzzy Fallback
-        if not os.path.exists(file_path):
-            base_pattern = safe_name.split("_")[0] + "*"
-            search_pattern = os.path.join(DATA_DIR, f"*{base_pattern}*_Consolidated_Report.pdf")
-            candidates = glob.glob(search_pattern)
-            if candidates:
-                file_path = candidates[0]
-                filename = os.path.basename(file_path)
-            else:
-                # Try iterating all files to find partial match
-                all_pdfs = glob.glob(os.path.join(DATA_DIR, "*_Consolidated_Report.pdf"))
-                found = False
-                for pdf in all_pdfs:
-                    # Check if company name is inside the filename (case insensitive)
-                    if clean_company.lower() in os.path.basename(pdf).lower().replace("_", " "):
-                        file_path = pdf
-                        filename = os.path.basename(pdf)
-                        found = True
-                        break
-                
-                if not found:
-                    raise HTTPException(status_code=404, detail="Report not found")
+        # Directory scan + stat run in the threadpool so the event loop stays free
+        file_path, filename, stat_result = await asyncio.to_thread(_locate_report_pdf, company)
 
-        return FileResponse(path=file_path, filename=filename, media_type='application/pdf')
+        # Pass the stat result so Content-Length is set without a second stat syscall
+        return ReportFileResponse(path=file_path, filename=filename, media_type='application/pdf', stat_result=stat_result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# --- REPORT HEADER DECODER ---
+# Listing only needs the company name, so decode just these two keys;
+# msgspec skips every other section at the C layer instead of building dicts for them.
+class ReportHeader(msgspec.Struct, frozen=True):
+    company_name: Optional[str] = None
+    Company: Optional[str] = None
+
+_HEADER_DEC = msgspec.json.Decoder(ReportHeader)
+
+# --- REPORT INDEX CACHE ---
+# Keyed by JSON path -> (st_mtime_ns, st_size, entry). A file is only re-read
+# and re-parsed when its mtime/size changes, so warm listings touch no report bodies.
+_REPORT_CACHE = {}
+_REPORT_CACHE_LOCK = threading.Lock()
+
+# Lookup structures derived from the cache; rebuilt (and rebound) only when a report is added/changed/removed
+_REPORT_INDEX = {"entries": [], "by_name": {}, "name_lc": [], "pdf_by_norm_key": {}}
+
+def _report_data(entry):
+    """Full report body for an index entry, decoded with orjson on first access only"""
+    if entry["data"] is None:
+        entry["data"] = orjson.loads(_read_bytes(entry["path"]))
+    return entry["data"]
+
+# Compiled once at import: corporate suffixes to strip, then anything non-alphanumeric
+_NORM_STRIP = re.compile(r'ltd|limited|india')
+_NORM_NONALNUM = re.compile(r'[^a-z0-9]')
+
+def _normalize_company(name):
+    """'Tata Motors Ltd' -> 'tatamotors' (removes spaces/case/Ltd)"""
+    return _NORM_NONALNUM.sub('', _NORM_STRIP.sub('', name.lower()))
+
+# Memoized filename -> preliminary key, e.g. "Tata_Motors_Ltd_Consolidated_Report.json" -> "tatamotors"
+_FILENAME_TO_PREKEY = {}
+
+def _filename_prekey(filename):
+    prekey = _FILENAME_TO_PREKEY.get(filename)
+    if prekey is None:
+        stem = filename.rsplit(_SUFFIX_JSON, 1)[0]
+        prekey = _FILENAME_TO_PREKEY[filename] = _normalize_company(stem.replace("_", " "))
+    return prekey
+
+def _load_report_index():
+    """
+    Returns the report index for DATA_DIR:
+      - entries: {path, filename, name, norm_key, data} per report, in directory order
+                 (reports without an internal company name are skipped; `data` is
+                 loaded lazily via _report_data)
+      - by_name: {official_name: entry}
+      - name_lc: [(lowercase_name, official_name)] for fuzzy substring matching
+      - pdf_by_norm_key: {norm_key: [sibling PDF paths]} (PDFs may not exist yet); the
+                 normalized filename stem is also registered as an alias key
+    The returned dict is an immutable snapshot: rebuilds replace it, so callers fetch it once.
+    """
+    global _REPORT_INDEX
+    if not os.path.exists(DATA_DIR):
+        return {"entries": [], "by_name": {}, "name_lc": [], "pdf_by_norm_key": {}}
+
+    with _REPORT_CACHE_LOCK:
+        entries = []
+        seen_paths = set()
+        changed = False
+
+        for dir_entry in _iter_reports(_SUFFIX_JSON):
+            path = dir_entry.path
+            seen_paths.add(path)
+            try:
+                st = dir_entry.stat()
+                cached = _REPORT_CACHE.get(path)
+
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    entry = cached[2]
+                else:
+                    header = _HEADER_DEC.decode(_read_bytes(path))
+
+                    # Extract the OFFICIAL name from inside the report
+                    # (e.g., "Tata Motors Ltd" instead of the filename "tatu_motors")
+                    official_name = header.company_name or header.Company
+                    entry = {
+                        "path": path,
+                        "filename": dir_entry.name,
+                        "name": official_name,
+                        "norm_key": _normalize_company(official_name) if official_name else None,
+                        "data": None,
+                    }
+                    _REPORT_CACHE[path] = (st.st_mtime_ns, st.st_size, entry)
+                    changed = True
+            except Exception as e:
+                print(f"⚠️ Error reading {path}: {e}")
+                _REPORT_CACHE.pop(path, None)
+                changed = True
+                continue
+
+            if entry["name"]:
+                entries.append(entry)
+
+        # Invalidate entries whose file has disappeared
+        for stale in set(_REPORT_CACHE) - seen_paths:
+            del _REPORT_CACHE[stale]
+            changed = True
+
+        if changed:
+            by_name = {entry["name"]: entry for entry in entries}
+
+            pdf_by_norm_key = {}
+            for entry in entries:
+                pdf_path = entry["path"][:-len(_SUFFIX_JSON)] + _SUFFIX_PDF
+                pdf_by_norm_key.setdefault(entry["norm_key"], []).append(pdf_path)
+            # Filename-derived keys are lookup aliases only (labels always come from the
+            # report header); they rank after every header-derived match for the same key
+            for entry in entries:
+                pdf_path = entry["path"][:-len(_SUFFIX_JSON)] + _SUFFIX_PDF
+                aliases = pdf_by_norm_key.setdefault(_filename_prekey(entry["filename"]), [])
+                if pdf_path not in aliases:
+                    aliases.append(pdf_path)
+
+            # Swapped in as one new dict: a caller's snapshot never mixes two rebuilds
+            _REPORT_INDEX = {
+                "entries": entries,
+                "by_name": by_name,
+                "name_lc": [(name.lower(), name) for name in by_name],
+                "pdf_by_norm_key": pdf_by_norm_key,
+            }
+
+        return _REPORT_INDEX
+
 # --- DEDUPLICATED REPORT LISTING ---
 @app.get("/api/reports")
 def list_reports():
@@ -225,34 +404,16 @@ def list_reports():
     if not os.path.exists(DATA_DIR):
         return {"reports": []}
     
-    files = glob.glob(os.path.join(DATA_DIR, "*_Consolidated_Report.json"))
-    
     # Dictionary to track unique entities: { normalized_name: report_metadata }
     unique_entities = {}
     
-    for f in files:
-        try:
-            with open(f, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-                
-                # 1. Extract the OFFICIAL name from inside the report
-                # (e.g., "Tata Motors Ltd" instead of the filename "tatu_motors")
-                official_name = data.get("company_name") or data.get("Company")
-                
-                if official_name:
-                    # 2. Normalize to create a unique key (removes spaces/case/Ltd)
-                    # "Tata Motors Ltd" -> "tatamotors"
-                    norm_key = re.sub(r'[^a-z0-9]', '', official_name.lower().replace("ltd", "").replace("limited", "").replace("india", ""))
-                    
-                    # 3. Store only the first occurrence (or overwrite if you prefer latest)
-                    if norm_key not in unique_entities:
-                        unique_entities[norm_key] = {
-                            "filename": os.path.basename(f), # Keep filename for download link
-                            "name": official_name,           # Display the Official Name
-                        }
-        except Exception as e:
-            print(f"⚠️ Error reading {f}: {e}")
-            continue
+    for entry in _load_report_index()["entries"]:
+        # Store only the first occurrence (or overwrite if you prefer latest)
+        if entry["norm_key"] not in unique_entities:
+            unique_entities[entry["norm_key"]] = {
+                "filename": entry["filename"], # Keep filename for download link
+                "name": entry["name"],         # Display the Official Name
+            }
 
     # Convert values back to list
     deduplicated_reports = list(unique_entities.values())
@@ -275,33 +436,26 @@ def compare_reports(request: CompareRequest):
     if not os.path.exists(DATA_DIR):
         return {"status": "success", "data": []}
         
-    all_files = glob.glob(os.path.join(DATA_DIR, "*_Consolidated_Report.json"))
-    report_map = {} # Key: Company Name, Value: JSON Data
-    
-    # Pre-load mapping: "Tata Motors Ltd" -> {json_data}
-    for f in all_files:
-        try:
-            with open(f, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                name = data.get("company_name") or data.get("Company")
-                if name:
-                    report_map[name] = data
-        except:
-            continue
+    # Cached mapping: "Tata Motors Ltd" -> index entry, plus prebuilt lowercase names.
+    # Only the matched reports get their full body decoded.
+    index = _load_report_index()  # One snapshot: by_name and name_lc come from the same rebuild
+    report_map = index["by_name"]
 
     # 2. Find requested companies in the map
     for req_company in request.companies:
         # A. Try Direct Match
-        if req_company in report_map:
-            comparison_data.append(report_map[req_company])
+        entry = report_map.get(req_company)
+        if entry is not None:
+            comparison_data.append(_report_data(entry))
         else:
             # B. Fallback: Try fuzzy matching if direct name match fails
             # This handles cases where frontend asks for "Ford" but map has "Ford Motor Co"
+            req_lc = req_company.lower()
             match_found = False
-            for map_name, data in report_map.items():
+            for name_lc, map_name in index["name_lc"]:
                 # Case insensitive substring matching
-                if req_company.lower() in map_name.lower() or map_name.lower() in req_company.lower():
-                    comparison_data.append(data)
+                if req_lc in name_lc or name_lc in req_lc:
+                    comparison_data.append(_report_data(report_map[map_name]))
                     match_found = True
                     break
             
@@ -310,24 +464,32 @@ def compare_reports(request: CompareRequest):
 
     return {"status": "success", "data": comparison_data}
 
+def _run_audit_sync(company):
+    """Blocking part of /api/audit: runs the pipeline and reads back the generated report"""
+    orchestrator = ComplianceOrchestrator()
+    os.makedirs(RAW_DIR, exist_ok=True)
+    os.makedirs(DATA_DIR, exist_ok=True)
+    
+    report = orchestrator.run_pipeline(target_company=company, specific_files=None)
+    if report is not None:
+        return report
+    
+    safe_name = company.replace(" ", "_")
+    try:
+        return orjson.loads(_read_bytes(f"{_DATA_PREFIX}{safe_name}{_SUFFIX_JSON}"))
+    except FileNotFoundError:
+        return None
+
 @app.post("/api/audit")
-def run_audit(request: AuditRequest):
+async def run_audit(request: AuditRequest):
     # REST Fallback endpoint (if WebSocket fails)
     company = request.company_name
     print(f"🚀 REST API received request for: {company}")
     try:
-        orchestrator = ComplianceOrchestrator()
-        os.makedirs(RAW_DIR, exist_ok=True)
-        os.makedirs(DATA_DIR, exist_ok=True)
-        
-        orchestrator.run_pipeline(target_company=company, specific_files=None)
-        
-        safe_name = company.replace(" ", "_")
-        json_path = os.path.join(DATA_DIR, f"{safe_name}_Consolidated_Report.json")
-        
-        if os.path.exists(json_path):
-            with open(json_path, "r", encoding="utf-8") as f:
-                return {"status": "success", "data": json.load(f)}
+        report = await asyncio.to_thread(_run_audit_sync, company)
+
+        if report is not None:
+            return {"status": "success", "data": report}
         return {"status": "error", "message": "Report generation failed"}
     except Exception as e:
         print(f"❌ API Error: {e}")
@@ -339,6 +501,21 @@ if __name__ == "__main__":
     # 2. Default to 8000 if running locally
     port = int(os.environ.get("PORT", 8000))
     
-    # 3. Host MUST be "0.0.0.0" to be accessible from the internet
+    # 3. Single worker unless WEB_CONCURRENCY is set explicitly: each worker loads its own
+    #    models/caches, so scaling out is an opt-in deployment decision.
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    
+    # 4. Host MUST be "0.0.0.0" to be accessible from the internet
     #    "127.0.0.1" will BLOCK all external connections (causing 502 Error)
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    #    uvloop + httptools ship with uvicorn[standard] (uvloop is not available on Windows).
+    #    Multiple workers need the app as an import string, resolved from BASE_DIR.
+    uvicorn.run(
+        "main:app",
+        app_dir=BASE_DIR,
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+    )
\ No newline at end of file
@@ -1,6 +1,6 @@
 import sys
 import os
-import json
+import orjson
 import streamlit as st
 import pandas as pd
 import time
@@ -96,13 +96,29 @@ with st.sidebar:
 # --- Main Dashboard ---
 csv_path = "data/03_structured/Master_Compliance_Tracker.csv"
 
+@st.cache_data(show_spinner=False)
+def load_tracker(path, mtime):
+    """Reads the master tracker once per file version (`mtime` only keys the cache)"""
+    # Arrow-backed parse: multithreaded reader + Arrow strings instead of Python objects
+    return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow')
+
 if os.path.exists(csv_path):
-    full_df = pd.read_csv(csv_path)
+    full_df = load_tracker(csv_path, os.path.getmtime(csv_path))
     
     # Filter for current session if active
     if st.session_state['session_companies']:
-        pattern = '|'.join([re.escape(str(c)) for c in st.session_state['session_companies']])
-        df_to_show = full_df[full_df['Company'].astype(str).str.contains(pattern, case=False, na=False)]
+        session_companies = st.session_state['session_companies']
+        companies = full_df['Company']
+        # Exact names: hash-set membership instead of a regex scan over every row
+        mask = companies.isin(session_companies)
+
+        # Names with no exact row fall back to partial, case-insensitive matching
+        exact_hits = set(companies[mask].unique())
+        unresolved = [c for c in session_companies if c not in exact_hits]
+        if unresolved:
+            pattern = '|'.join([re.escape(str(c)) for c in unresolved])
+            mask = mask | companies.str.contains(pattern, case=False, na=False)
+        df_to_show = full_df[mask]
     else:
         df_to_show = full_df.tail(5)
 
@@ -125,8 +141,8 @@ if os.path.exists(csv_path):
             json_path = os.path.join("data/03_structured", f"{safe_name}_Consolidated_Report.json")
             
             if os.path.exists(json_path):
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(json_path, "rb") as f:
+                    data = orjson.loads(f.read())
                 
                 t1, t2, t3, t4 = st.tabs(["📊 Workforce", "⚖️ Legal Checks", "🔗 Supply Chain", "📥 Download"])
                 
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from typing import List
+from pydantic import BaseModel, Field, TypeAdapter
 
 class DocumentInput(BaseModel):
     """
@@ -15,4 +16,7 @@ class DocumentInput(BaseModel):
     )
     
     class Config:
-        frozen = True # Makes instances immutable and hashable
\ No newline at end of file
+        frozen = True # Makes instances immutable and hashable
+
+# Built once at import: validates a whole batch of documents in a single pydantic-core call
+DOC_LIST_ADAPTER = TypeAdapter(List[DocumentInput])
\ No newline at end of file
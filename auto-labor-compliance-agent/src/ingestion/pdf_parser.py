@@ -1,5 +1,12 @@
 import os
+import re
+import bisect
+import hashlib
+import tempfile
+import threading
 import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import fitz  # PyMuPDF for fast pre-checks
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
@@ -9,52 +16,120 @@ from langsmith import traceable
 
 # Import Contract for Type Safety
 from src.contracts.inputs import DocumentInput
+from src.utils.fitz_lock import FITZ_LOCK
+from src.reasoning.audit_pillars import ANCHOR_PHRASES
 
 # Disable SSL Verify for corporate environments
 os.environ['HF_HUB_DISABLE_SSL_VERIFY'] = '1'
 os.environ['CURL_CA_BUNDLE'] = ''
 
+# Long filings are only converted around the sections the auditor reads:
+# every phrase the audit prompt anchors on, plus the note/BRSR headings it cites
+PAGE_BOUND_MIN_PAGES = 40
+SECTION_MARKERS = tuple(dict.fromkeys(ANCHOR_PHRASES + ("employee benefit", "principle 3")))
+COVER_PAGES = 3       # Always kept: identity checks read the first pages
+SPAN_BEFORE, SPAN_AFTER = 1, 2  # Minimum pages of context around each marker hit
+MAX_SECTION_PAGES = 12  # A hit's span runs to the next section heading, at most this far
+# Section starts when the PDF has no outline (BRSR principles and sections), on lowercased text
+_HEADING_PATTERN = r"^\s*(?:principle\s+\d+\b|section\s+[abc]\s*[:\-–])"
+_HEADING_RE = re.compile(_HEADING_PATTERN, re.M)
+# Part of the parse-cache file names: changing the span rules never serves stale truncated markdown
+SPAN_CONFIG_KEY = hashlib.sha256(repr((
+    PAGE_BOUND_MIN_PAGES, SECTION_MARKERS, COVER_PAGES, SPAN_BEFORE, SPAN_AFTER,
+    MAX_SECTION_PAGES, _HEADING_PATTERN,
+)).encode()).hexdigest()[:12]
+TABLE_PROBE_PAGES = 40  # Table probe depth when the whole document is converted
+
+@dataclass(frozen=True)
+class PdfDiagnosis:
+    is_scanned: bool   # Needs OCR
+    has_tables: bool   # Worth running TableFormer
+
 class SanePDFParser:
     def __init__(self):
         print("🔧 Initializing HYBRID Parser (Smart Mode)...")
         # We don't instantiate the backend here, we pass the class type to format_options
         self.backend_cls = PyPdfiumDocumentBackend
+        # One converter per pipeline config (PdfDiagnosis); Docling loads its models lazily per instance
+        self._converters = {}
+        self._converters_lock = threading.Lock()  # Candidates are parsed from a thread pool
+        # Docling's convert() is not thread-safe: the pool overlaps hashing, cache reads and
+        # PyMuPDF pre-checks, but conversions themselves run one at a time
+        self._convert_lock = threading.Lock()
+        # Parse cache keyed by file content hash (re-ingesting the same PDF skips Docling)
+        self.cache_dir = "data/.docling_cache"
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _file_fingerprint(file_path: str) -> str:
+        """SHA-256 of the file bytes, streamed in 1 MiB chunks."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
 
-    def _is_scanned_pdf(self, file_path: str) -> bool:
+    @staticmethod
+    def _atomic_write(path: str, text: str):
+        # Unique temp name: two workers may cache the same fingerprint at once
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(path), suffix=".tmp", delete=False) as f:
+            f.write(text)
+        os.replace(f.name, path)
+
+    def _diagnose_pdf(self, file_path: str, spans: Optional[List[Tuple[int, int]]] = None) -> PdfDiagnosis:
         """
         🚀 0.5s Check: Does this PDF have embedded text, or is it just images?
-        Returns True if Scanned (needs OCR), False if Digital (fast).
+        For digital PDFs, also checks whether a page that will be converted carries a table
+        (the `spans` from _locate_target_pages, else the first TABLE_PROBE_PAGES); if none
+        does, TableFormer is skipped.
+        Scanned PDFs always keep table structure on: PyMuPDF can't see tables inside images.
         """
         try:
-            doc = fitz.open(file_path)
-            # Check up to first 3 pages (sufficient for determination)
-            pages_to_check = min(3, len(doc))
-            text_found = 0
+            # Candidates are parsed from a thread pool; PyMuPDF calls are serialized
+            with FITZ_LOCK:
+                doc = fitz.open(file_path)
+                # Check up to first 3 pages (sufficient for determination)
+                pages_to_check = min(3, len(doc))
+                digital_threshold = 50 * pages_to_check
+                text_found = 0
+                is_scanned = True
             
-            for i in range(pages_to_check):
-                text_found += len(doc[i].get_text())
+                for i in range(pages_to_check):
+                    # flags=0: no ligature/whitespace preservation, we only need the length
+                    text_found += len(doc[i].get_text("text", flags=0))
+                    if text_found >= digital_threshold:
+                        # Already enough text to call it digital; skip the remaining pages
+                        is_scanned = False
+                        break
             
-            doc.close()
+                if is_scanned:
+                    doc.close()
+                    # Threshold: If avg text per page < 50 chars, it's likely an image scan
+                    avg_text = text_found / pages_to_check if pages_to_check > 0 else 0
+                    print(f"   🔍 Diagnosis: SCANNED PDF (Avg {int(avg_text)} chars/page). Enabling OCR.")
+                    return PdfDiagnosis(is_scanned=True, has_tables=True)
             
-            # Threshold: If avg text per page < 50 chars, it's likely an image scan
-            avg_text = text_found / pages_to_check if pages_to_check > 0 else 0
+                # Only probe the pages Docling will actually see, stopping at the first table
+                if spans:
+                    probe_pages = (page_no - 1 for start, end in spans for page_no in range(start, end + 1))
+                else:
+                    probe_pages = range(min(TABLE_PROBE_PAGES, len(doc)))
+                has_tables = any(doc[i].find_tables().tables for i in probe_pages)
+                doc.close()
             
-            if avg_text < 50:
-                print(f"   🔍 Diagnosis: SCANNED PDF (Avg {int(avg_text)} chars/page). Enabling OCR.")
-                return True
-            else:
-                print(f"   🔍 Diagnosis: DIGITAL PDF (Avg {int(avg_text)} chars/page). Disabling OCR (Fast Mode).")
-                return False
+                print(f"   🔍 Diagnosis: DIGITAL PDF ({text_found} chars in first pages). Disabling OCR (Fast Mode)."
+                      f"{'' if has_tables else ' No tables found, skipping TableFormer.'}")
+                return PdfDiagnosis(is_scanned=False, has_tables=has_tables)
                 
         except Exception as e:
             print(f"   ⚠️ Pre-check warning: {e}. Defaulting to Safer Mode (OCR).")
-            return True
+            return PdfDiagnosis(is_scanned=True, has_tables=True)
 
-    def _get_pipeline_options(self, is_scanned: bool):
+    def _get_pipeline_options(self, diagnosis: PdfDiagnosis):
         """Dynamic Configuration based on PDF type"""
         options = PdfPipelineOptions()
         
-        if is_scanned:
+        if diagnosis.is_scanned:
             # SLOW BUT ACCURATE MODE (For Scans)
             options.do_ocr = True
             options.do_table_structure = True
@@ -65,38 +140,127 @@ class SanePDFParser:
         else:
             # 🚀 TURBO MODE (For Digital Reports)
             options.do_ocr = False  # <--- HUGE SPEEDUP
-            options.do_table_structure = True
+            options.do_table_structure = diagnosis.has_tables  # No tables -> no TableFormer pass
             options.table_structure_options.mode = TableFormerMode.FAST
             options.images_scale = 1.0 # Standard scale is fine for digital text extraction
             
         return options
 
+    def _get_converter(self, diagnosis: PdfDiagnosis) -> DocumentConverter:
+        with self._converters_lock:
+            converter = self._converters.get(diagnosis)
+            if converter is None:
+                converter = DocumentConverter(
+                    format_options={
+                        InputFormat.PDF: PdfFormatOption(
+                            pipeline_options=self._get_pipeline_options(diagnosis),
+                            backend=self.backend_cls # Pass the class, not instance
+                        )
+                    }
+                )
+                self._converters[diagnosis] = converter
+        return converter
+
+    def _locate_target_pages(self, file_path: str) -> List[Tuple[int, int]]:
+        """
+        For long digital PDFs, returns merged 1-based inclusive page spans around SECTION_MARKERS
+        (plus the cover pages). Each span runs from SPAN_BEFORE pages before a hit to the page
+        before the next section start (outline entry or BRSR heading), keeping at least SPAN_AFTER
+        and at most MAX_SECTION_PAGES pages after the hit.
+        Empty list means "convert the whole document".
+        """
+        try:
+            with FITZ_LOCK:
+                doc = fitz.open(file_path)
+                page_count = len(doc)
+                if page_count < PAGE_BOUND_MIN_PAGES:
+                    doc.close()
+                    return []
+
+                # Outline entries are [level, title, 1-based page]; each one starts a section
+                section_starts = {entry[2] for entry in doc.get_toc(simple=True) if entry[2] >= 1}
+                hits = []
+                for i in range(page_count):
+                    page_text = doc[i].get_text("text", flags=0).lower()
+                    if any(marker in page_text for marker in SECTION_MARKERS):
+                        hits.append(i + 1)
+                    if _HEADING_RE.search(page_text):
+                        section_starts.add(i + 1)
+                doc.close()
+        except Exception as e:
+            print(f"   ⚠️ Page scan warning: {e}. Converting full document.")
+            return []
+
+        if not hits:
+            return []
+
+        section_starts = sorted(section_starts)
+        spans = [(1, min(COVER_PAGES, page_count))]
+        for page_no in hits:
+            next_start = bisect.bisect_right(section_starts, page_no)
+            section_end = section_starts[next_start] - 1 if next_start < len(section_starts) else page_count
+            end = max(page_no + SPAN_AFTER, min(section_end, page_no + MAX_SECTION_PAGES))
+            start, end = max(1, page_no - SPAN_BEFORE), min(page_count, end)
+            if start <= spans[-1][1] + 1:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+            else:
+                spans.append((start, end))
+        return spans
+
     @traceable(name="PDF Parsing Task") 
     def parse_document(self, doc_input: DocumentInput) -> dict:
         print(f"📄 Processing {doc_input.filename}...")
         
         try:
-            # 1. Detect Type
-            is_scanned = self._is_scanned_pdf(doc_input.file_path)
+            # 0. Cache Lookup (same bytes -> same markdown)
+            fingerprint = self._file_fingerprint(doc_input.file_path)
+            # Keyed by content and span rules: both the markdown and the table probe depend on the spans
+            md_cache = os.path.join(self.cache_dir, f"{fingerprint}-{SPAN_CONFIG_KEY}.md")
+            flag_cache = os.path.join(self.cache_dir, f"{fingerprint}-{SPAN_CONFIG_KEY}.flag")
+            try:
+                with open(md_cache, "r", encoding="utf-8") as f:
+                    markdown_content = f.read()
+                print(f"   ⚡ Parse Cache Hit: {len(markdown_content)} chars.")
+                return {"content": markdown_content, "source": doc_input.filename}
+            except FileNotFoundError:
+                pass
+
+            # 1. Detect Type (reuse cached diagnosis if we have one)
+            # Flag format: "<is_scanned><has_tables>" e.g. "01"; older one-char flags imply tables
+            spans = None
+            try:
+                with open(flag_cache, "r", encoding="utf-8") as f:
+                    flag = f.read().strip()
+                diagnosis = PdfDiagnosis(is_scanned=flag[:1] == "1", has_tables=flag[1:2] != "0")
+            except FileNotFoundError:
+                # Spans first, so the table probe only looks at pages that will be converted
+                spans = self._locate_target_pages(doc_input.file_path)
+                diagnosis = self._diagnose_pdf(doc_input.file_path, spans)
+                self._atomic_write(flag_cache, f"{int(diagnosis.is_scanned)}{int(diagnosis.has_tables)}")
             
-            # 2. Configure Converter
-            pipeline_opts = self._get_pipeline_options(is_scanned)
+            # 2. Configure Converter (reused across documents with the same diagnosis)
+            converter = self._get_converter(diagnosis)
             
-            converter = DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(
-                        pipeline_options=pipeline_opts,
-                        backend=self.backend_cls # Pass the class, not instance
-                    )
-                }
-            )
-            
-            # 3. Convert
-            result = converter.convert(doc_input.file_path)
+            # 3. Convert (long digital filings: only the page spans around audited sections)
+            if diagnosis.is_scanned:
+                spans = []
+            elif spans is None:
+                spans = self._locate_target_pages(doc_input.file_path)
+            if spans:
+                print(f"   📑 Bounded Parse: {len(spans)} span(s) {spans}")
             
             # 4. Export
             # We use markdown as it preserves table structure well for LLMs
-            markdown_content = result.document.export_to_markdown()
+            with self._convert_lock:
+                if spans:
+                    markdown_content = "\n\n".join(
+                        converter.convert(doc_input.file_path, page_range=span).document.export_to_markdown()
+                        for span in spans
+                    )
+                else:
+                    result = converter.convert(doc_input.file_path)
+                    markdown_content = result.document.export_to_markdown()
+            self._atomic_write(md_cache, markdown_content)
             
             print(f"   ✅ Extraction Complete: {len(markdown_content)} chars.")
             return {"content": markdown_content, "source": doc_input.filename}
@@ -1,6 +1,13 @@
 # Specialized table handling logic# File: src/ingestion/table_extractor.py
 import re
 
+# Compiled once at import. The table row class is [^\n]+ (greedy, single line) so a miss
+# can't backtrack across the whole markdown like the old lazy (.+?) did.
+_EMP_BENEFIT_RE = re.compile(
+    r"(note\s+\d+[:\s]+employee\s+benefit\s+expense|employee\s+cost)([\s\S]{0,500}?)\|([^\n]+)\|\n\n",
+    re.IGNORECASE | re.MULTILINE
+)
+
 class FinancialTableExtractor:
     """
     Locates and extracts specific financial blocks from the Markdown.
@@ -14,9 +21,7 @@ class FinancialTableExtractor:
         """
         # Regex to find the header and the immediate next Markdown table
         # Matches: "## Note 24: Employee Benefit Expense" ... | Table | ...
-        pattern = r"(?i)(note\s+\d+[:\s]+employee\s+benefit\s+expense|employee\s+cost)([\s\S]{0,500}?)\|(.+?)\|(\n\n)"
-        
-        match = re.search(pattern, markdown_text, re.MULTILINE)
+        match = _EMP_BENEFIT_RE.search(markdown_text)
         if match:
             print("💰 Found 'Employee Benefit Expense' table.")
             return f"Context: {match.group(1)}\n\nTable:\n|{match.group(3)}|"
@@ -30,10 +35,12 @@ class FinancialTableExtractor:
         start_marker = "Principle 3"
         end_marker = "Principle 4"
         
-        if start_marker in markdown_text and end_marker in markdown_text:
-            start_idx = markdown_text.find(start_marker)
-            end_idx = markdown_text.find(end_marker)
-            print("herb Found BRSR Principle 3 section.")
-            return markdown_text[start_idx:end_idx]
+        # One find() per marker (the old `in` checks scanned the text twice)
+        start_idx = markdown_text.find(start_marker)
+        if start_idx != -1:
+            end_idx = markdown_text.find(end_marker, start_idx)
+            if end_idx != -1:
+                print("herb Found BRSR Principle 3 section.")
+                return markdown_text[start_idx:end_idx]
             
         return "SECTION_NOT_FOUND"
\ No newline at end of file
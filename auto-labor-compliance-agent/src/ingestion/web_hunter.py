@@ -1,17 +1,55 @@
 import os
+import orjson
+import hashlib
+import itertools
 import requests
-import time
 import re
 import shutil
-import pypdf
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import fitz  # PyMuPDF: much faster first-page text extraction than pypdf
 from dotenv import load_dotenv
 from tavily import TavilyClient
 from yahooquery import Ticker
 from urllib.parse import unquote
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Tuple
+
+from src.utils.fitz_lock import FITZ_LOCK
+
+try:
+    import ahocorasick  # Optional: single-pass multi-keyword poison scan
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # Optional: linear-time DFA matching for the provision snippet scan
+except ImportError:
+    re2 = None
 
 load_dotenv()
 
+MAX_PDF_BYTES = 50 * 1024 * 1024  # Reports beyond this are abandoned mid-download
+
+TAVILY_MAX_CONCURRENCY = 4  # In-flight Tavily searches across all hunter threads
+DOWNLOAD_INDEX_FILE = ".download_index.json"  # {"by_hash": {sha256: path}, "by_url": {url: sha256}}
+# Every hunter (one per audit, several target threads each) read-modify-writes the same index file
+_DOWNLOAD_INDEX_LOCK = threading.Lock()
+
+# Matches "₹ 50 Cr", "Rs 50 Cr", "INR 50 Cr" (inline (?i) so the same pattern compiles on RE2)
+_PROVISION_PATTERN = r'(?i)(?:Rs\.?|INR|₹)\s?(\d+[.,]?\d*)\s?(crore|cr)'
+_PROVISION_RE = (re2 or re).compile(_PROVISION_PATTERN)
+
+# Process-wide lookups shared by every WebHunter (one is built per audit), keyed by
+# normalized company name. Only successful answers are stored so transient failures retry.
+_TICKER_CACHE: Dict[str, str] = {}
+_FINANCIALS_CACHE: Dict[str, Dict[str, str]] = {}
+_LOOKUP_LOCK = threading.Lock()
+
+def _lookup_key(company_name: str) -> str:
+    return " ".join(company_name.lower().split())
+
 class WebHunter:
     def __init__(self):
         api_key = os.getenv("TAVILY_API_KEY")
@@ -23,6 +61,16 @@ class WebHunter:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
         self.seen_urls = set()
+        self._seen_lock = threading.Lock()
+        self._poison_automata = {}
+        self._poison_cache = {}  # lowercased company name -> poison tuple
+        self._tavily_sem = threading.BoundedSemaphore(TAVILY_MAX_CONCURRENCY)
+        self._download_indexes = {}  # output_folder -> persisted content-hash index
+
+        # Shared keep-alive pool: targets download in parallel and reuse connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
         # Hardcoded Poison Map for Conglomerates (The "Do Not Touch" List)
         self.conglomerate_map = {
@@ -31,19 +79,37 @@ class WebHunter:
             "mahindra": ["tech", "finance", "lifespace", "holidays", "logistics"],
             "godrej": ["properties", "agrovet", "consumer"]
         }
+        # Pre-lowered, immutable view of the map for the per-company lookup
+        self._conglomerate_items = tuple(
+            (key.lower(), tuple(poisons)) for key, poisons in self.conglomerate_map.items()
+        )
+
+    def _tavily_search(self, query: str, **kwargs):
+        """All Tavily calls go through here: bursts up to TAVILY_MAX_CONCURRENCY, no fixed sleeps."""
+        with self._tavily_sem:
+            return self.client.search(query=query, **kwargs)
 
     def _get_poison_keywords(self, company_name: str) -> List[str]:
         """Returns list of forbidden keywords based on the target company."""
-        company_lower = company_name.lower()
-        for key, poisons in self.conglomerate_map.items():
-            if key in company_lower:
-                return poisons
-        return []
+        return list(self._poisons_for(company_name.lower()))
+
+    def _poisons_for(self, company_lower: str) -> tuple:
+        poisons = self._poison_cache.get(company_lower)
+        if poisons is None:
+            poisons = next((p for key, p in self._conglomerate_items if key in company_lower), ())
+            self._poison_cache[company_lower] = poisons
+        return poisons
 
     def get_financial_truth(self, company_name: str):
         """
         🚀 Fetches 'Financial Truth' using yahooquery (More stable than yfinance)
         """
+        cache_key = _lookup_key(company_name)
+        with _LOOKUP_LOCK:
+            cached = _FINANCIALS_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         print(f"   💰 Financial API: Hunting truth data for {company_name}...")
         
         ticker_symbol = self._find_ticker(company_name)
@@ -73,16 +139,23 @@ class WebHunter:
             financials['API_Employee_Cost'] = self._format_currency(emp_cost) if emp_cost else "N/A"
 
             print(f"   ✅ Financial Truth Acquired for {ticker_symbol}")
-            return financials
+            with _LOOKUP_LOCK:
+                _FINANCIALS_CACHE[cache_key] = financials
+            return dict(financials)
 
         except Exception as e:
             print(f"   ❌ Financial API Error: {e}")
             return None
 
-    def _find_ticker(self, company_name):
+    def _find_ticker(self, company_name: str):
+        cache_key = _lookup_key(company_name)
+        with _LOOKUP_LOCK:
+            ticker = _TICKER_CACHE.get(cache_key)
+        if ticker:
+            return ticker
         try:
             query = f"{company_name} yahoo finance ticker symbol India"
-            results = self.client.search(query, max_results=1)
+            results = self._tavily_search(query, max_results=1)
             
             if results['results']:
                 url = results['results'][0]['url']
@@ -90,7 +163,11 @@ class WebHunter:
                     parts = url.split("quote/")
                     if len(parts) > 1:
                         raw_ticker = parts[1].split("/")[0].split("?")[0]
-                        return unquote(raw_ticker)
+                        ticker = unquote(raw_ticker)
+                        if ticker:
+                            with _LOOKUP_LOCK:
+                                _TICKER_CACHE[cache_key] = ticker
+                        return ticker
             return None
         except Exception:
             return None
@@ -103,6 +180,139 @@ class WebHunter:
         except:
             return "N/A"
 
+    def _download_pdf(self, url: str, temp_path: str) -> Optional[str]:
+        """
+        Streams a candidate PDF to temp_path in 64 KiB chunks and returns its SHA-256 (None on reject).
+        Aborts early on non-200, missing %PDF magic or files over MAX_PDF_BYTES.
+        """
+        with self.session.get(url, timeout=15, stream=True) as r:
+            if r.status_code != 200:
+                return None
+            # Servers label PDFs inconsistently (application/x-pdf, force-download, ...), so the
+            # Content-Type is only a hint; the magic-byte check below is what actually rejects
+            content_type = r.headers.get("Content-Type", "").lower()
+            if content_type and "pdf" not in content_type and "octet-stream" not in content_type:
+                print(f"     ⚠️ Unexpected Content-Type '{content_type}', checking %PDF- header.")
+
+            # Magic-byte check before touching disk: ".pdf" links are often HTML error/login pages
+            chunks = r.iter_content(chunk_size=65536)
+            first = next(chunks, b"")
+            if not first.startswith(b"%PDF-"):
+                print("     ⛔ REJECTED DOWNLOAD: Missing %PDF- header.")
+                return None
+
+            size = 0
+            digest = hashlib.sha256()
+            with open(temp_path, 'wb') as f:
+                for chunk in itertools.chain((first,), chunks):
+                    size += len(chunk)
+                    if size > MAX_PDF_BYTES:
+                        print(f"     ⛔ REJECTED DOWNLOAD: Exceeds {MAX_PDF_BYTES // (1024 * 1024)} MB cap.")
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+                else:
+                    if size:
+                        return digest.hexdigest()
+
+        os.remove(temp_path)
+        return None
+
+    @staticmethod
+    def _read_download_index(output_folder: str) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(os.path.join(output_folder, DOWNLOAD_INDEX_FILE), "rb") as f:
+                index = orjson.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            index = {}
+        index.setdefault("by_hash", {})
+        index.setdefault("by_url", {})
+        return index
+
+    def _get_download_index(self, output_folder: str) -> Dict[str, Dict[str, str]]:
+        """Loads (once) the content-hash index of previously accepted downloads. Caller holds _seen_lock."""
+        index = self._download_indexes.get(output_folder)
+        if index is None:
+            index = self._download_indexes[output_folder] = self._read_download_index(output_folder)
+        return index
+
+    def _copy_known_download(self, url: str, temp_path: str, output_folder: str) -> Optional[str]:
+        """If this URL was accepted before (any company), copies the local bytes to temp_path instead of re-downloading."""
+        with self._seen_lock:
+            index = self._get_download_index(output_folder)
+            sha = index["by_url"].get(url)
+            local_path = index["by_hash"].get(sha) if sha else None
+        if not local_path:
+            return None
+        try:
+            shutil.copyfile(local_path, temp_path)
+        except FileNotFoundError:
+            return None
+        print("     ♻️ Reusing local bytes (content-hash match), skipping download.")
+        return sha
+
+    def _remember_download(self, url: str, sha: str, final_path: str, output_folder: str):
+        # Re-read under the process-wide lock so entries saved by other threads/hunters survive
+        with _DOWNLOAD_INDEX_LOCK:
+            index = self._read_download_index(output_folder)
+            index["by_hash"][sha] = final_path
+            index["by_url"][url] = sha
+            with tempfile.NamedTemporaryFile("wb", dir=output_folder, suffix=".tmp", delete=False) as f:
+                f.write(orjson.dumps(index, option=orjson.OPT_INDENT_2))
+            os.replace(f.name, os.path.join(output_folder, DOWNLOAD_INDEX_FILE))
+        with self._seen_lock:
+            self._download_indexes[output_folder] = index
+
+    def _content_scanner(self, poison_keywords: List[str], core_name: str) -> Callable[[str], Tuple[Optional[str], bool]]:
+        """
+        Returns a function that walks normalized text once and reports
+        (first whole-word poison term or None, whether core_name occurs as a substring).
+        Built once per (keyword set, name): an Aho-Corasick automaton when pyahocorasick
+        is installed, otherwise a compiled poison alternation plus a substring check.
+        """
+        key = (frozenset(poison_keywords), core_name)
+        scanner = self._poison_automata.get(key)
+        if scanner is not None:
+            return scanner
+
+        poisons = key[0]
+        name_always_found = not core_name  # Empty name is trivially "found", like `"" in text`
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for poison in poisons:
+                automaton.add_word(f" {poison} ", poison)
+            if core_name:
+                automaton.add_word(core_name, None)
+            has_words = bool(poisons) or bool(core_name)
+            if has_words:
+                automaton.make_automaton()
+
+            def scanner(text: str) -> Tuple[Optional[str], bool]:
+                name_found = name_always_found
+                if has_words:
+                    for _, poison in automaton.iter(text):
+                        if poison is not None:
+                            return poison, name_found
+                        name_found = True
+                return None, name_found
+        else:
+            # Poisons get their own pattern: folded into one alternation with the name, a
+            # non-overlapping scan would swallow a poison that sits inside the name match
+            # (e.g. "motors" in "tata motors"). Lookarounds let adjacent poisons share a space.
+            poison_re = None
+            if poisons:
+                poison_alt = "|".join(map(re.escape, sorted(poisons, key=len, reverse=True)))
+                poison_re = re.compile(f"(?<= )(?:{poison_alt})(?= )")
+
+            def scanner(text: str) -> Tuple[Optional[str], bool]:
+                name_found = name_always_found or core_name in text
+                match = poison_re.search(text) if poison_re is not None else None
+                return (match.group(0) if match else None), name_found
+
+        self._poison_automata[key] = scanner
+        return scanner
+
     def _verify_pdf_content(self, file_path: str, target_company: str, poison_keywords: List[str]) -> bool:
         """
         THE SURE SHOT VALIDATOR:
@@ -112,32 +322,38 @@ class WebHunter:
         3. Target name presence (Confirm)
         """
         try:
-            reader = pypdf.PdfReader(file_path)
-            
-            # Security Check
-            if reader.is_encrypted:
-                print("     ⛔ REJECTED CONTENT: PDF is encrypted/locked.")
-                return False
+            # Targets verify from parallel threads; PyMuPDF calls are serialized
+            with FITZ_LOCK:
+                doc = fitz.open(file_path)
+                
+                # Security Check
+                if doc.needs_pass or doc.is_encrypted:
+                    doc.close()
+                    print("     ⛔ REJECTED CONTENT: PDF is encrypted/locked.")
+                    return False
 
-            if len(reader.pages) < 1: return False
-            
-            # Read first 2 pages (Title pages usually)
-            text = ""
-            for i in range(min(2, len(reader.pages))):
-                text += reader.pages[i].extract_text().lower() + " "
-            
-            # Normalize text (remove newlines/tabs)
-            text = re.sub(r'\s+', ' ', text)
-            
-            # 1. Poison Check
-            for poison in poison_keywords:
-                if f" {poison} " in text: # Check for whole words e.g. " finance "
-                    print(f"     ⛔ REJECTED CONTENT: Found poison term '{poison}' in document.")
+                if doc.page_count < 1:
+                    doc.close()
                     return False
+                
+                # Read first 2 pages (Title pages usually)
+                text = ""
+                for i in range(min(2, doc.page_count)):
+                    text += doc[i].get_text("text").lower() + " "
+                doc.close()
+            
+            # Normalize text (remove newlines/tabs); split() already treats all \s as separators.
+            # Keep the trailing space the per-page join used to leave, so end-of-text words still match.
+            text = " ".join(text.split()) + " "
             
-            # 2. Positive Confirmation
+            # 1. Poison Check + 2. Positive Confirmation, fused into a single pass over the text
             core_name = target_company.lower().replace("limited", "").replace("ltd", "").strip()
-            if core_name not in text:
+            poison, name_found = self._content_scanner(poison_keywords, core_name)(text) # Poisons are whole words e.g. " finance "
+            if poison:
+                print(f"     ⛔ REJECTED CONTENT: Found poison term '{poison}' in document.")
+                return False
+            
+            if not name_found:
                 print(f"     ⛔ REJECTED CONTENT: Target '{core_name}' NOT found in first pages.")
                 return False
                 
@@ -184,61 +400,79 @@ class WebHunter:
             }
         ]
         
-        found_files = []
-        for target in targets:
-            safe_name = company_name.replace(' ', '_').replace('"', '')
-            final_filename = f"{safe_name}_{target['type']}.pdf"
-            final_path = os.path.join(output_folder, final_filename)
-            
-            # Skip if valid file exists
-            if os.path.exists(final_path):
-                print(f"   ✅ Local copy exists: {final_filename}")
-                found_files.append(final_path)
-                continue
+        safe_name = company_name.replace(' ', '_').replace('"', '')
+        os.makedirs(output_folder, exist_ok=True)  # Per-target temp files are created up front
+        out_prefix = os.path.join(output_folder, f"{safe_name}_")  # Joined once for all targets
+        
+        # 4. Search + download all targets concurrently (network-bound)
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            results = pool.map(
+                lambda target: self._process_target(target, company_name, out_prefix, output_folder, all_exclusions),
+                targets
+            )
+            found_files = [path for path in results if path]
+        return found_files
+
+    def _process_target(self, target: Dict[str, str], company_name: str, out_prefix: str, output_folder: str, all_exclusions: List[str]) -> Optional[str]:
+        """Searches one target type and returns the path of the first verified PDF (or None)."""
+        final_path = f"{out_prefix}{target['type']}.pdf"
+        
+        # Skip if valid file exists
+        if os.path.exists(final_path):
+            print(f"   ✅ Local copy exists: {os.path.basename(final_path)}")
+            return final_path
+        
+        # Unique temp file per target call (targets and concurrent hunts run in parallel),
+        # reused for every candidate URL
+        fd, temp_path = tempfile.mkstemp(dir=output_folder, prefix=f"temp_{target['type']}_", suffix=".pdf")
+        os.close(fd)
+        
+        print(f"   🔍 Searching for {target['type']}...")
+        try:
+            # Use "Advanced" depth for better financial results
+            response = self._tavily_search(target['query'], search_depth="advanced", max_results=5)
             
-            print(f"   🔍 Searching for {target['type']}...")
-            try:
-                # Use "Advanced" depth for better financial results
-                response = self.client.search(query=target['query'], search_depth="advanced", max_results=5)
-                
-                if 'results' in response:
-                    for result in response['results']:
-                        url = result['url']
-                        if url in self.seen_urls: continue
-                        if not url.lower().endswith('.pdf'): continue
+            if 'results' in response:
+                for result in response['results']:
+                    url = result['url']
+                    if url in self.seen_urls: continue
+                    if not url.lower().endswith('.pdf'): continue
+                    
+                    # --- THE SURE SHOT DOWNLOAD PROTOCOL ---
+                    # 1. Download to Temp
+                    print(f"   ⬇️ Inspecting: {url.split('/')[-1][:30]}...")
+                    
+                    try:
+                        sha = self._copy_known_download(url, temp_path, output_folder) or self._download_pdf(url, temp_path)
+                        if not sha:
+                            continue
+                        # 2. Verify Content (The Gatekeeper)
+                        if self._verify_pdf_content(temp_path, company_name, all_exclusions):
+                            with self._seen_lock:
+                                claimed = url in self.seen_urls
+                                self.seen_urls.add(url)
+                            if claimed:
+                                # Another target accepted this exact file first
+                                os.remove(temp_path)
+                                continue
+                            # 3. Accept & Rename
+                            shutil.move(temp_path, final_path)
+                            self._remember_download(url, sha, final_path, output_folder)
+                            print(f"   ✅ Verified & Saved: {os.path.basename(final_path)}")
+                            return final_path # Stop searching for this target, we found a good one
+                        else:
+                            # 4. Reject & Delete
+                            os.remove(temp_path)
+                            print("     ❌ File rejected by Content Validator.")
+                    except Exception as e:
+                        print(f"     ⚠️ Download/Read Error: {e}")
+                        if os.path.exists(temp_path): os.remove(temp_path)
                         
-                        # --- THE SURE SHOT DOWNLOAD PROTOCOL ---
-                        # 1. Download to Temp
-                        print(f"   ⬇️ Inspecting: {url.split('/')[-1][:30]}...")
-                        temp_path = os.path.join(output_folder, "temp_download.pdf")
-                        
-                        try:
-                            # Added verify=False for robustness against corporate firewalls (optional)
-                            r = requests.get(url, headers=self.headers, timeout=15)
-                            if r.status_code == 200:
-                                with open(temp_path, 'wb') as f:
-                                    f.write(r.content)
-                                
-                                # 2. Verify Content (The Gatekeeper)
-                                if self._verify_pdf_content(temp_path, company_name, all_exclusions):
-                                    # 3. Accept & Rename
-                                    shutil.move(temp_path, final_path)
-                                    print(f"   ✅ Verified & Saved: {final_filename}")
-                                    self.seen_urls.add(url)
-                                    found_files.append(final_path)
-                                    break # Stop searching for this target, we found a good one
-                                else:
-                                    # 4. Reject & Delete
-                                    os.remove(temp_path)
-                                    print("     ❌ File rejected by Content Validator.")
-                        except Exception as e:
-                            print(f"     ⚠️ Download/Read Error: {e}")
-                            if os.path.exists(temp_path): os.remove(temp_path)
-                            
-            except Exception as e:
-                print(f"   ❌ Search Error: {e}")
-            time.sleep(1)
-        return found_files
+        except Exception as e:
+            print(f"   ❌ Search Error: {e}")
+        finally:
+            if os.path.exists(temp_path): os.remove(temp_path)
+        return None
 
     def fetch_sector_provisions(self, custom_targets: Optional[Dict[str, List[str]]] = None):
         """
@@ -250,19 +484,23 @@ class WebHunter:
             "Ancillaries": ["Bharat Forge", "Motherson Sumi", "Bosch Ltd", "Uno Minda"]
         }
         
+        # Independent Tavily lookups: one future per distinct company (shared if listed in several categories)
         sector_data = {key: [] for key in targets.keys()}
-        for category, companies in targets.items():
-            for company in companies:
-                print(f"     > Scanning {company}...")
-                result = self._scan_single_provision(company)
-                sector_data[category].append(result)
+        companies = list(dict.fromkeys(c for members in targets.values() for c in members))
+        if not companies:
+            return sector_data
+        with ThreadPoolExecutor(max_workers=min(8, len(companies))) as pool:
+            futures = {company: pool.submit(self._scan_single_provision, company) for company in companies}
+            for category, members in targets.items():
+                sector_data[category] = [futures[company].result() for company in members]
         return sector_data
 
     def _scan_single_provision(self, company_name: str) -> Dict:
+        print(f"     > Scanning {company_name}...")
         # Enhanced regex to capture '₹' symbol as well
         query = f'"{company_name}" Q3 FY26 financial results "exceptional item" "labour code" provision amount crore'
         try:
-            response = self.client.search(query=query, search_depth="basic", max_results=1)
+            response = self._tavily_search(query, search_depth="basic", max_results=1)
             impact, status, source_url = "Not Disclosed", "Stable", "#"
             
             if 'results' in response and response['results']:
@@ -271,8 +509,7 @@ class WebHunter:
                 if "provision" in content.lower() or "exceptional" in content.lower():
                     impact = "Provision Likely"
                     status = "Medium Impact"
-                    # UPDATED: Matches "₹ 50 Cr", "Rs 50 Cr", "INR 50 Cr"
-                    match = re.search(r'(?:Rs\.?|INR|₹)\s?(\d+[\.,]?\d*)\s?([Cc]rore|[Cc]r)', content, re.IGNORECASE)
+                    match = _PROVISION_RE.search(content)
                     if match:
                         impact = f"₹ {match.group(1)} Cr"
                         status = "High Impact"
@@ -1,27 +1,260 @@
 import os
-import glob
 import re
+import bisect
 import pandas as pd
-import json
-import difflib  # --- NEW: Fuzzy Matching Library ---
+import copy
+import csv
+import functools
+import orjson
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from rapidfuzz import process, fuzz  # C++ fuzzy matching (replaces difflib)
 from typing import List, Optional, Dict
+from pydantic import BaseModel
 from langsmith import traceable 
 
-# --- REPORTLAB IMPORTS (For Professional PDF Generation) ---
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+try:
+    import ahocorasick  # Optional: one pass over the header for poisons + aliases together
+except ImportError:
+    ahocorasick = None
+
+# ReportLab (PDF generation) is imported lazily inside the PDF builders: cache hits never pay for it
 
 # --- MODULE IMPORTS ---
 # Ensure these match your project structure
-from src.contracts.inputs import DocumentInput
+from src.contracts.inputs import DOC_LIST_ADAPTER
 from src.ingestion.pdf_parser import SanePDFParser
 from src.reasoning.audit_engine import AuditEngine
 from src.ingestion.web_hunter import WebHunter
 
+PARSE_WORKERS = 4  # Candidate PDFs parsed concurrently (hunter returns at most 4)
+MASTER_CSV_FILE = "Master_Compliance_Tracker.csv"
+MASTER_INDEX_FILE = ".master_csv_index.json"  # Sidecar: master CSV header + (Company, Period) keys
+_MASTER_CSV_LOCK = threading.Lock()  # Concurrent audits append/rewrite the tracker and its index one at a time
+
+# Gatekeeper "Do Not Entry" list: subsidiaries / JVs that must never pass for the parent
+POISON_MAP = {
+    "bajaj auto": ["bajaj finance", "bajaj finserv", "bajaj holdings", "bajaj electricals", "bajaj consumer", "bajaj allianz", "housing"],
+    "tata motors": ["tata steel", "tata power", "tcs", "consultancy", "chemicals", "elxsi"],
+    "mahindra": ["tech mahindra", "mahindra finance", "mahindra lifespace", "club mahindra", "mahindra logistics"],
+    "godrej": ["properties", "agrovet", "consumer"],
+    "maruti": ["jay bharat", "machino", "jbm", "suzuki motor gujarat"]
+}
+
+# Filename marker -> document type, first match wins (same precedence as the old if/elif chain)
+DOC_TYPE_RULES = (
+    ("BRSR", "BRSR / Sustainability Report"),
+    ("Annual", "Annual Financial Report"),
+    ("Investor", "Investor Presentation"),
+    ("EHS", "EHS Report"),
+    ("Financial", "Quarterly Results"),
+)
+
+# Values the LLM uses for "no figure extracted" (triggers the API patch)
+MISSING_INDICATORS = frozenset({"N/A", "Not Disclosed", "0", None, "", "USD 0", "INR 0"})
+
+# Hot-path patterns, compiled once
+_NONALNUM = re.compile(r'[^a-z0-9]')
+_WS = re.compile(r'\s+')
+_CLEAN_NAME = re.compile(r'ltd|limited|[^a-z0-9]')  # Corporate suffixes + underscores/punctuation
+_REPORT_SUFFIX_LEN = len("_Consolidated_Report.json")
+# Culprit keywords learned from a rejected document, matched as substrings in one scan
+_EXCLUSION_KEYWORDS = re.compile(r'finance|holdings|consumer|electrical|finserv|housing|logistics')
+
+# Master CSV row layout: (column, path into the nested report, default). Column order is CSV order.
+_FLATTEN_SCHEMA = (
+    ("Company", ("company_name",), "N/A"),
+    ("Period", ("report_period",), "N/A"),
+    ("Risk Score", ("overall_risk_score",), "N/A"),
+    ("Labour_Provision", ("labour_code_impact", "provision_amount"), "N/A"),
+    ("Labour_Provision_Desc", ("labour_code_impact", "impact_description"), "N/A"),
+    ("Top_Products", ("business_intel", "key_products"), ()),
+    ("Major_Customers", ("business_intel", "major_customers"), ()),
+    ("Top_Vendors", ("vendors",), ()),
+    ("Wage_Status", ("labor_code_analysis", "wages", "minimum_wage_status", "status"), "N/A"),
+    ("Health_Status", ("labor_code_analysis", "osh", "safety_systems_status", "status"), "N/A"),
+    ("Strike_Risk", ("labor_code_analysis", "ir", "disputes_strikes_status", "status"), "N/A"),
+    ("Workforce_Turnover", ("workforce_profile", 0, "turnover_rate"), "N/A"),
+    ("Strategic_Action", ("strategic_plan", "recommendations", 0), "N/A"),
+)
+# List columns joined into one cell, with an optional cap on the number of items
+_FLATTEN_JOINED = {"Top_Products": None, "Major_Customers": None, "Top_Vendors": 5}
+
+# Top-level report sections the PDF reads, in unpacking order, with the fallback for dict reports
+_PDF_SECTIONS = (
+    ("labour_code_impact", {}), ("business_intel", {}), ("executive_summary", {}), ("vendors", []),
+    ("supply_chain_compliance", {}), ("api_financials", {}), ("labor_code_analysis", {}),
+    ("workforce_profile", []), ("strategic_plan", {}),
+)
+
+@functools.lru_cache(maxsize=None)
+def _area_label(field_name: str) -> str:
+    """'minimum_wage_status' -> 'Minimum Wage'. Field names are a fixed schema set: derived once, shared by every row."""
+    return field_name.replace('_', ' ').replace('status', '').strip().title()
+
+# --- REPORTLAB STYLES (built lazily: reportlab is only imported when a PDF is rendered) ---
+@functools.lru_cache(maxsize=1)
+def _pdf_styles() -> Dict[str, "ParagraphStyle"]:
+    """Corporate paragraph styles: built on the first PDF, shared by every orchestrator and report"""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+
+    # Custom Corporate Styles
+    return {
+        'title': ParagraphStyle(
+            'MainTitle', 
+            parent=styles['Heading1'], 
+            fontSize=24, 
+            textColor=colors.HexColor('#0f172a'), 
+            spaceAfter=20
+        ),
+        'h2': ParagraphStyle(
+            'SectionHeader', 
+            parent=styles['Heading2'], 
+            fontSize=14, 
+            textColor=colors.HexColor('#1e40af'), 
+            borderPadding=5, 
+            borderColor=colors.HexColor('#e2e8f0'), 
+            borderWidth=0, 
+            spaceBefore=15, 
+            spaceAfter=10
+        ),
+        'normal': ParagraphStyle(
+            'BodyText', 
+            parent=styles['Normal'], 
+            fontSize=10, 
+            leading=14, 
+            spaceAfter=6
+        ),
+        'status_green': ParagraphStyle('StatusGreen', parent=styles['Normal'], fontSize=9, fontName='Helvetica-Bold', textColor=colors.green),
+        'status_red': ParagraphStyle('StatusRed', parent=styles['Normal'], fontSize=9, fontName='Helvetica-Bold', textColor=colors.red),
+        'status_orange': ParagraphStyle('StatusOrange', parent=styles['Normal'], fontSize=9, fontName='Helvetica-Bold', textColor=colors.orange),
+        'footer': ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey, alignment=TA_CENTER),
+    }
+
+@functools.lru_cache(maxsize=1)
+def _section_headers() -> Dict[str, "Paragraph"]:
+    """Static section headers; callers copy a header before adding it to a story"""
+    from reportlab.platypus import Paragraph
+
+    pdf_styles = _pdf_styles()
+    h2_style = pdf_styles['h2']
+    return {
+        "intel": Paragraph("1. Forensic Business Intelligence", h2_style),
+        "summary": Paragraph("2. Executive Summary", h2_style),
+        "supply_chain": Paragraph("3. Supply Chain & Vendor Intelligence", h2_style),
+        "financials": Paragraph("4. Financial Intelligence", h2_style),
+        "workforce": Paragraph("6. Workforce Profile", h2_style),
+        "strategy": Paragraph("7. Strategic Recommendations", h2_style),
+        "code_wages": Paragraph("5A. Wages & Remuneration", h2_style),
+        "code_osh": Paragraph("5B. OSH & Safety", h2_style),
+        "code_ir": Paragraph("5C. Industrial Relations", h2_style),
+        "code_social_security": Paragraph("5D. Social Security", h2_style),
+        "intel_products": Paragraph("<b>KEY PRODUCTS</b>", pdf_styles['normal']),
+        "intel_customers": Paragraph("<b>MAJOR CUSTOMERS</b>", pdf_styles['normal']),
+        "vendors_caption": Paragraph("<b>Key Vendors Identified (Related Parties):</b>", pdf_styles['normal']),
+        "vendors_empty": Paragraph("<i>No specific vendor names extracted from available documents.</i>", pdf_styles['normal']),
+        "workforce_empty": Paragraph("No detailed workforce data extracted.", pdf_styles['normal']),
+        "footer": Paragraph("Generated by SANE-AI AutoLabor Agent • Forensic Audit Protocol", pdf_styles['footer']),
+    }
+
+@functools.lru_cache(maxsize=1)
+def _table_styles() -> Dict[str, "TableStyle"]:
+    """Table style commands are constant data: compiled once, shared by every report's tables"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return {
+        "risk_low": TableStyle([
+            ('BACKGROUND', (0,0), (-1,-1), colors.green), 
+            ('TEXTCOLOR', (0,0), (-1,-1), colors.white), 
+            ('ALIGN', (0,0), (-1,-1), 'CENTER'), 
+            ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+            ('TOPPADDING', (0,0), (-1,-1), 6),
+        ]),
+        "risk_moderate": TableStyle([
+            ('BACKGROUND', (0,0), (-1,-1), colors.orange), 
+            ('TEXTCOLOR', (0,0), (-1,-1), colors.white), 
+            ('ALIGN', (0,0), (-1,-1), 'CENTER'), 
+            ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+            ('TOPPADDING', (0,0), (-1,-1), 6),
+        ]),
+        "risk_high": TableStyle([
+            ('BACKGROUND', (0,0), (-1,-1), colors.red), 
+            ('TEXTCOLOR', (0,0), (-1,-1), colors.white), 
+            ('ALIGN', (0,0), (-1,-1), 'CENTER'), 
+            ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+            ('TOPPADDING', (0,0), (-1,-1), 6),
+        ]),
+        "provision": TableStyle([
+            ('BOX', (0,0), (-1,-1), 1, colors.red), 
+            ('BACKGROUND', (0,0), (-1,-1), colors.HexColor('#fff1f1')), 
+            ('PADDING', (0,0), (-1,-1), 10)
+        ]),
+        "intel": TableStyle([
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey), 
+            ('VALIGN', (0,0), (-1,-1), 'TOP'), 
+            ('PADDING', (0,0), (-1,-1), 8),
+            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#f1f5f9')) # Header row background
+        ]),
+        "summary": TableStyle([
+            ('BOX', (0,0), (-1,-1), 1, colors.HexColor('#cbd5e1')),
+            ('BACKGROUND', (0,0), (-1,-1), colors.HexColor('#f8fafc')),
+            ('PADDING', (0,0), (-1,-1), 12),
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+        ]),
+        "vendors": TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('PADDING', (0,0), (-1,-1), 2),
+            ('TEXTCOLOR', (0,0), (-1,-1), colors.HexColor('#334155')),
+        ]),
+        "liability": TableStyle([
+            ('BACKGROUND', (0,0), (-1,-1), colors.HexColor('#fff1f2')), # Light Red
+            ('BOX', (0,0), (-1,-1), 1, colors.HexColor('#fda4af')),
+            ('PADDING', (0,0), (-1,-1), 8),
+        ]),
+        "financials": TableStyle([
+            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0f172a')), # Header Blue
+            ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0,0), (-1,-1), 10),
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+            ('PADDING', (0,0), (-1,-1), 8),
+            ('BACKGROUND', (0,1), (-1,-1), colors.white), # Data White
+            ('TEXTCOLOR', (0,1), (-1,-1), colors.black),
+        ]),
+        "compliance": TableStyle([
+            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#e2e8f0')), # Header Grey
+            ('TEXTCOLOR', (0,0), (-1,0), colors.black),
+            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('INNERGRID', (0,0), (-1,-1), 0.25, colors.lightgrey),
+            ('BOX', (0,0), (-1,-1), 0.5, colors.grey),
+            ('PADDING', (0,0), (-1,-1), 6),
+        ]),
+        "workforce": TableStyle([
+            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#1e40af')),
+            ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+            ('ALIGN', (1,0), (-1,-1), 'RIGHT'), # Numbers aligned right
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+            ('PADDING', (0,0), (-1,-1), 6),
+            ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.whitesmoke, colors.white]),
+        ]),
+        "recommendations": TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('PADDING', (0,0), (-1,-1), 4),
+        ]),
+    }
+
 class ComplianceOrchestrator:
     def __init__(self):
         print("🔧 Initializing SANE-AI Compliance Orchestrator (Monolithic Protocol)...")
@@ -31,6 +264,14 @@ class ComplianceOrchestrator:
         self.engine = AuditEngine(model_name="gemini-2.0-flash")
         self.hunter = WebHunter()
         self.structured_dir = "data/03_structured"
+        self._file_map_cache: Optional[tuple] = None  # (dir mtime_ns, {clean_name: file_path}, sorted clean names)
+        self._parse_cache: Dict[tuple, str] = {}  # (path, mtime_ns, size) -> parsed markdown
+        self._gatekeeper_automata: Dict[str, object] = {}  # target (lowercased) -> Aho-Corasick automaton
+        # One alternation regex per entity: a single scan of the header instead of N substring checks
+        self._poison_patterns = [
+            (key, re.compile("|".join(map(re.escape, poisons))))
+            for key, poisons in POISON_MAP.items()
+        ]
 
     # --- 1. WEBSOCKET BRIDGE HELPER ---
     def _emit_update(self, message: str, percent: int, callback=None):
@@ -47,43 +288,68 @@ class ComplianceOrchestrator:
                 print(f"  ⚠️ WebSocket Emit Failed: {e}")
 
     # --- 2. CACHE HANDLER: FUZZY MATCHING & SELF-HEALING ---
+    def _get_file_map(self) -> Dict[str, str]:
+        """
+        Builds {clean_name: file_path} for the archive, re-listing only when the directory's
+        mtime changes (a report was added/removed) or after _save_json wrote one.
+        """
+        try:
+            dir_mtime = os.stat(self.structured_dir).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if self._file_map_cache and self._file_map_cache[0] == dir_mtime:
+            return self._file_map_cache[1]
+
+        file_map = {}
+        with os.scandir(self.structured_dir) as entries:
+            for entry in entries:
+                fname = entry.name
+                if fname.startswith(".") or not fname.endswith("_Consolidated_Report.json"):
+                    continue
+                # Remove suffix and standard corporate words to get the "core" name
+                # e.g., "Tata_Motors_Ltd" -> "tatamotors" (one regex pass over the lowered stem)
+                clean_name = _CLEAN_NAME.sub('', fname[:-_REPORT_SUFFIX_LEN].lower())
+                file_map[clean_name] = entry.path
+
+        # Sorted keys let prefix lookups bisect instead of scanning every name
+        self._file_map_cache = (dir_mtime, file_map, sorted(file_map))
+        return file_map
+
     def _check_existing_report(self, company_name: str) -> Optional[Dict]:
         """
         Looks for existing reports using FUZZY MATCHING to handle typos and spelling mistakes.
         Example: "tatu motors" (input) -> matches "Tata_Motors_Ltd_Consolidated_Report.json" (file)
         """
-        if not os.path.exists(self.structured_dir):
-            return None
-
         # 1. Normalize input: "tatu motors" -> "tatumotors"
-        clean_input = re.sub(r'[^a-z0-9]', '', company_name.lower())
+        clean_input = _NONALNUM.sub('', company_name.lower())
         
-        # Get all existing JSON reports
-        existing_files = glob.glob(os.path.join(self.structured_dir, "*_Consolidated_Report.json"))
-        if not existing_files: return None
-
-        # Build a map of {clean_name: file_path}
-        file_map = {}
-        for f in existing_files:
-            fname = os.path.basename(f)
-            # Remove suffix and standard corporate words to get the "core" name
-            core_name = fname.replace("_Consolidated_Report.json", "").replace("_", "")
-            # e.g., "Tata_Motors_Ltd" -> "tatamotors"
-            clean_name = re.sub(r'[^a-z0-9]', '', core_name.lower().replace("ltd", "").replace("limited", ""))
-            file_map[clean_name] = f
+        # Map of {clean_name: file_path} for all existing JSON reports (memoized)
+        file_map = self._get_file_map()
+        if not file_map: return None
 
         # A. Exact/Substring Match (Fastest)
+        if clean_input in file_map:
+            return self._load_and_log(file_map[clean_input], company_name, "Exact Match")
+
+        # Prefix hit via bisect on the sorted names ("tatamotors" -> "tatamotorsltd...")
+        sorted_names = self._file_map_cache[2]
+        pos = bisect.bisect_left(sorted_names, clean_input)
+        if pos < len(sorted_names) and sorted_names[pos].startswith(clean_input):
+            return self._load_and_log(file_map[sorted_names[pos]], company_name, "Substring Match")
+
+        # Remaining substring cases: input inside a name, or a (shorter) name inside the input
+        input_len = len(clean_input)
         for clean_name, file_path in file_map.items():
-            if clean_input in clean_name or clean_name in clean_input:
+            if (len(clean_name) <= input_len and clean_name in clean_input) or clean_input in clean_name:
                 return self._load_and_log(file_path, company_name, "Substring Match")
 
         # B. Fuzzy Match (The "Spelling Mistake" Fix)
-        # difflib.get_close_matches finds the closest string in the list
-        # cutoff=0.6 means 60% similarity is required (handles 'tatu' vs 'tata')
-        matches = difflib.get_close_matches(clean_input, file_map.keys(), n=1, cutoff=0.6)
+        # extractOne finds the closest string in the list; fuzz.ratio is the normalized Indel
+        # similarity (same scale as difflib's ratio), so score_cutoff=60 keeps the old 0.6 cutoff
+        match = process.extractOne(clean_input, file_map.keys(), scorer=fuzz.ratio, score_cutoff=60)
         
-        if matches:
-            best_match = matches[0]
+        if match:
+            best_match = match[0]
             matched_file = file_map[best_match]
             return self._load_and_log(matched_file, company_name, f"Fuzzy Match ({best_match})")
         
@@ -94,8 +360,8 @@ class ComplianceOrchestrator:
         try:
             filename = os.path.basename(file_path)
             print(f"🎯 CACHE HIT [{match_type}]: Requested '{requested_name}' -> Found '{filename}'")
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(file_path, "rb") as f:
+                return orjson.loads(f.read())
         except Exception as e:
             print(f"⚠️ Error reading cache file {file_path}: {e}")
             return None
@@ -144,6 +410,11 @@ class ComplianceOrchestrator:
             # Safe Fallback
             return f'"{company_name}" Annual Report 2024 filetype:pdf'
 
+    @staticmethod
+    def _infer_doc_type(filename: str) -> str:
+        """Auto-tag document type from the hunter's filename convention"""
+        return next((label for marker, label in DOC_TYPE_RULES if marker in filename), "Supporting Document")
+
     def _semantic_validation(self, raw_text: str, target_company: str, filename: str) -> bool:
         """
         ANTI-PATTERN GATEKEEPER (FIXED for Mahindra):
@@ -154,43 +425,33 @@ class ComplianceOrchestrator:
         # --- 1. Text Normalization ---
         # Convert to lower case and replace newlines/tabs with single spaces
         # We assume the header/identity is in the first 5000 chars (Expanded Scan)
-        header_text = re.sub(r'\s+', ' ', raw_text[:5000].lower())
+        header_text = _WS.sub(' ', raw_text[:5000].lower())
         
         target_lower = target_company.lower()
-        
-        # --- 2. Poison Check (The "Do Not Entry" List) ---
-        # Strict checking prevents getting the wrong subsidiary
-        poison_map = {
-            "bajaj auto": ["bajaj finance", "bajaj finserv", "bajaj holdings", "bajaj electricals", "bajaj consumer", "bajaj allianz", "housing"],
-            "tata motors": ["tata steel", "tata power", "tcs", "consultancy", "chemicals", "elxsi"],
-            "mahindra": ["tech mahindra", "mahindra finance", "mahindra lifespace", "club mahindra", "mahindra logistics"],
-            "godrej": ["properties", "agrovet", "consumer"],
-            "maruti": ["jay bharat", "machino", "jbm", "suzuki motor gujarat"]
-        }
-        
-        for key, poisons in poison_map.items():
-            if key in target_lower:
-                for poison in poisons:
-                    # Only reject if the poison term is in the header area
-                    # We check first 5000 chars now as per requirement
-                    check_zone = header_text 
-                    
-                    if poison in check_zone:
-                        print(f"   ⛔ GATEKEEPER REJECTED: {filename}")
-                        print(f"      Reason: Found Poison Entity '{poison}' in document header/title.")
-                        return False # REJECT
-        
-        # --- 3. Positive Confirmation (The "Must Be Present" Check) ---
-        clean_target = target_lower.replace("limited", "").replace("ltd", "").strip()
-        valid_aliases = [clean_target]
+        valid_aliases = self._target_aliases(target_lower)
 
-        # --- FIX 3: ADD ALIASES FOR MAHINDRA (Relaxed Name Check) ---
-        if "mahindra" in target_lower:
-            # If we passed the poison check, accept generic "Mahindra" or "M&M"
-            valid_aliases.extend(["m&m", "mahindra & mahindra", "mahindra and mahindra", "mahindra"])
-            
-        # Check if ANY valid alias is present
-        is_confirmed = any(alias in header_text for alias in valid_aliases)
+        if ahocorasick is not None:
+            # --- 2+3. Poisons and aliases in a single linear pass over the header ---
+            poison_hit, is_confirmed = self._scan_header(header_text, target_lower, valid_aliases)
+        else:
+            # --- 2. Poison Check (The "Do Not Entry" List) ---
+            # Strict checking prevents getting the wrong subsidiary
+            # Only reject if the poison term is in the header area (first 5000 chars)
+            poison_hit = None
+            for key, pattern in self._poison_patterns:
+                if key in target_lower:
+                    match = pattern.search(header_text)
+                    if match:
+                        poison_hit = match.group(0)
+                        break
+
+            # --- 3. Positive Confirmation (The "Must Be Present" Check) ---
+            is_confirmed = any(alias in header_text for alias in valid_aliases)
+
+        if poison_hit:
+            print(f"   ⛔ GATEKEEPER REJECTED: {filename}")
+            print(f"      Reason: Found Poison Entity '{poison_hit}' in document header/title.")
+            return False # REJECT
 
         if not is_confirmed:
             print(f"   ⛔ GATEKEEPER REJECTED: {filename}")
@@ -201,49 +462,108 @@ class ComplianceOrchestrator:
 
         return True
 
-    @traceable(name="Full Audit Pipeline", run_type="chain")
-    def run_pipeline(self, specific_files: Optional[List[str]] = None, target_company: str = "Consolidated Entity", progress_callback=None):
+    @staticmethod
+    def _target_aliases(target_lower: str) -> List[str]:
+        """Names that confirm the document belongs to the target (Alias-Aware: M&M, etc.)"""
+        clean_target = target_lower.replace("limited", "").replace("ltd", "").strip()
+        valid_aliases = [clean_target]
+
+        # --- FIX 3: ADD ALIASES FOR MAHINDRA (Relaxed Name Check) ---
+        if "mahindra" in target_lower:
+            # If we passed the poison check, accept generic "Mahindra" or "M&M"
+            valid_aliases.extend(["m&m", "mahindra & mahindra", "mahindra and mahindra", "mahindra"])
+        return valid_aliases
+
+    def _scan_header(self, header_text: str, target_lower: str, valid_aliases: List[str]):
+        """
+        Runs the target's Aho-Corasick automaton over the header once.
+        Returns (first poison found or None, whether any alias was found).
+        """
+        automaton = self._gatekeeper_automata.get(target_lower)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            # Aliases first: a word that is also a poison is overwritten and rejects, as before
+            for alias in valid_aliases:
+                if alias:
+                    automaton.add_word(alias, (False, alias))
+            for key, poisons in POISON_MAP.items():
+                if key in target_lower:
+                    for poison in poisons:
+                        automaton.add_word(poison, (True, poison))
+            if len(automaton):
+                automaton.make_automaton()
+            self._gatekeeper_automata[target_lower] = automaton
+
+        is_confirmed = "" in valid_aliases  # Empty alias is trivially "found", like `"" in text`
+        if not len(automaton):
+            return None, is_confirmed
+        for _, (is_poison, word) in automaton.iter(header_text):
+            if is_poison:
+                return word, is_confirmed
+            is_confirmed = True
+        return None, is_confirmed
+
+    @staticmethod
+    def _is_missing(value) -> bool:
+        return str(value).strip() in MISSING_INDICATORS
+
+    def _parse_text(self, doc_input) -> str:
+        """
+        Parsed text memoized per (path, mtime, size) for this orchestrator, so retry attempts that
+        see the same physical PDF skip even the parser's content-hash lookup.
+        """
+        stat = os.stat(doc_input.file_path)
+        key = (doc_input.file_path, stat.st_mtime_ns, stat.st_size)
+        raw_text = self._parse_cache.get(key)
+        if raw_text is None:
+            parse_result = self.parser.parse_document(doc_input) # Parses text
+            raw_text = parse_result["content"]
+            if parse_result.get("source") != "Error":
+                self._parse_cache[key] = raw_text
+        return raw_text
+
+    def _parse_and_validate(self, doc_input, target_company: str):
+        """Worker for the parallel candidate check: returns (raw_text, passed_gatekeeper)."""
+        raw_text = self._parse_text(doc_input)
+        return raw_text, self._semantic_validation(raw_text, target_company, doc_input.filename)
+
+    def _serve_cached(self, cached_report: Dict, target_company: str, progress_callback=None) -> Dict:
+        self._emit_update("⚡ Archive Match Found! Loading existing forensic data...", 90, progress_callback)
         
-        # --- PHASE 0: ARCHIVE CHECK (CACHE-FIRST + FUZZY) ---
-        self._emit_update(f"🔍 Searching local archive for {target_company}...", 2, progress_callback)
-        cached_report = self._check_existing_report(target_company)
+        # --- CRITICAL FIX: CACHE ALIGNMENT (AUTO-MIRRORING) ---
+        # If user typed "tatu motors" but we found "Tata_Motors.json",
+        # we must SAVE a copy as "tatu_motors.json" so the API finds it.
+        safe_name_requested = target_company.replace(" ", "_")
+        self._save_json(cached_report, f"{safe_name_requested}_Consolidated_Report.json")
         
-        if cached_report:
-            self._emit_update("⚡ Archive Match Found! Loading existing forensic data...", 90, progress_callback)
-            
-            # --- CRITICAL FIX: CACHE ALIGNMENT (AUTO-MIRRORING) ---
-            # If user typed "tatu motors" but we found "Tata_Motors.json",
-            # we must SAVE a copy as "tatu_motors.json" so the API finds it.
-            safe_name_requested = target_company.replace(" ", "_")
-            self._save_json(cached_report, f"{safe_name_requested}_Consolidated_Report.json")
-            
-            self._emit_update("✅ Audit Loaded from Archive.", 100, progress_callback)
-            return cached_report
+        self._emit_update("✅ Audit Loaded from Archive.", 100, progress_callback)
+        return cached_report
 
+    def _gather_text(self, specific_files: Optional[List[str]], target_company: str, progress_callback=None) -> Optional[str]:
+        """Stages 1-2: hunt (or take the given files), gatekeep and consolidate text. None = abort."""
         # --- STAGE 1: INITIALIZATION (0-5%) ---
         self._emit_update(f"🚀 No archive found. Initializing SANE-AI Protocol for {target_company}...", 5, progress_callback)
         
-        financial_truth = None 
-        full_consolidated_text = ""
+        text_parts: List[str] = []  # Joined once after ingestion (no repeated string reallocation)
         
         # --- STAGE 2: HUNTING (5-50%) ---
         # If files are NOT provided, we hunt for them with retry logic
         if not specific_files:
             valid_files = []
             attempt = 0
-            current_exclusions = [] # Start with no specific exclusions
+            current_exclusions = set() # Start with no specific exclusions (set: duplicates never accumulate)
             
             # Retry Loop (Max 3 attempts to correct course)
             while attempt < 3:
                 if attempt > 0:
-                    self._emit_update(f"🔄 Retrying search with Exclusion Filter: {current_exclusions}", 10 + (attempt * 5), progress_callback)
+                    self._emit_update(f"🔄 Retrying search with Exclusion Filter: {sorted(current_exclusions)}", 10 + (attempt * 5), progress_callback)
 
                 # Dynamic progress calculation based on attempt
                 base_progress = 10 + (attempt * 10)
                 self._emit_update(f"🌍 Hunting for documents (Attempt {attempt+1})...", base_progress, progress_callback)
                 
                 # 1. Hunt with current exclusions
-                candidates = self.hunter.hunt_for_company(target_company, exclusions=current_exclusions)
+                candidates = self.hunter.hunt_for_company(target_company, exclusions=list(current_exclusions))
                 
                 if not candidates:
                     self._emit_update("⚠️ No files found via Deep Search.", base_progress + 5, progress_callback)
@@ -253,56 +573,65 @@ class ComplianceOrchestrator:
                 files_passed_validation = []
                 rejection_occured = False
                 
-                total_candidates = len(candidates)
-                for idx, file_path in enumerate(candidates):
-                    filename = os.path.basename(file_path)
-                    
-                    # Calculate granular progress for each file
-                    step_progress = base_progress + int((idx / total_candidates) * 20)
-                    self._emit_update(f"🔎 Inspecting: {filename}...", step_progress, progress_callback)
-                    
-                    # Auto-tag document type
-                    doc_type = "Supporting Document"
-                    if "BRSR" in filename: doc_type = "BRSR / Sustainability Report"
-                    elif "Annual" in filename: doc_type = "Annual Financial Report"
-                    elif "Investor" in filename: doc_type = "Investor Presentation"
-                    elif "EHS" in filename: doc_type = "EHS Report"
-                    elif "Financial" in filename: doc_type = "Quarterly Results" 
+                # Build every candidate's contract in one validator call (auto-tagged doc type)
+                doc_inputs = DOC_LIST_ADAPTER.validate_python([
+                    {"filename": os.path.basename(fp), "file_path": fp, "doc_type": self._infer_doc_type(os.path.basename(fp))}
+                    for fp in candidates
+                ])
+
+                total_candidates = len(doc_inputs)
+                for doc_input in doc_inputs:
+                    self._emit_update(f"🔎 Inspecting: {doc_input.filename}...", base_progress, progress_callback)
+                
+                # Parse + gatekeep all candidates in parallel (cache hits, hashing and gatekeeping overlap;
+                # the parser serializes Docling conversions and PyMuPDF pre-checks)
+                outcomes = [None] * total_candidates
+                with ThreadPoolExecutor(max_workers=min(PARSE_WORKERS, total_candidates)) as pool:
+                    futures = {
+                        pool.submit(self._parse_and_validate, doc_input, target_company): idx
+                        for idx, doc_input in enumerate(doc_inputs)
+                    }
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        idx = futures[future]
+                        filename = doc_inputs[idx].filename
+                        # Calculate granular progress for each finished file
+                        step_progress = base_progress + int((done / total_candidates) * 20)
+                        try:
+                            raw_text, passed = future.result()
+                        except Exception as e:
+                            print(f" ❌ Error validating {filename}: {e}")
+                            continue
+                        outcomes[idx] = (raw_text, passed)
+                        if passed:
+                            self._emit_update(f"✅ Verified & Locked: {filename}", step_progress, progress_callback)
+                        else:
+                            self._emit_update(f"⛔ Rejected: {filename} (Invalid Content)", step_progress, progress_callback)
+
+                # Accumulate in candidate order so the consolidated text is deterministic
+                for doc_input, outcome in zip(doc_inputs, outcomes):
+                    if outcome is None:
+                        continue
+                    raw_text, passed = outcome
+                    filename = doc_input.filename
+                    file_path = doc_input.file_path
+                    doc_type = doc_input.doc_type
                     
-                    try:
-                        doc_input = DocumentInput(filename=filename, file_path=file_path, doc_type=doc_type)
-                        parse_result = self.parser.parse_document(doc_input) # Parses text
-                        raw_text = parse_result["content"]
+                    if passed:
+                        files_passed_validation.append(file_path)
+                        # CRITICAL: We add headers so the AuditEngine's "Searcher" can find sections easily
+                        text_parts.append(f"\n\n=== SOURCE DOCUMENT: {doc_type} ({filename}) ===\n{raw_text}\n===========================================\n")
+                    else:
+                        # 3. LEARN from the mistake
+                        # We normalize text to find the culprit keyword
+                        clean_text = _WS.sub(' ', raw_text[:5000].lower())
                         
-                        # GATEKEEPER CHECK
-                        if self._semantic_validation(raw_text, target_company, filename):
-                            self._emit_update(f"✅ Verified & Locked: {filename}", step_progress + 2, progress_callback)
-                            files_passed_validation.append(file_path)
-                            # Accumulate text for the final report immediately
-                            # CRITICAL: We add headers so the AuditEngine's "Searcher" can find sections easily
-                            full_consolidated_text += f"\n\n=== SOURCE DOCUMENT: {doc_type} ({filename}) ===\n{raw_text}\n===========================================\n"
-                        else:
-                            # 3. LEARN from the mistake
-                            # We normalize text to find the culprit keyword
-                            clean_text = re.sub(r'\s+', ' ', raw_text[:5000].lower())
-                            
-                            if "finance" in clean_text: current_exclusions.append("finance")
-                            if "holdings" in clean_text: current_exclusions.append("holdings")
-                            if "consumer" in clean_text: current_exclusions.append("consumer")
-                            if "electrical" in clean_text: current_exclusions.append("electrical")
-                            if "finserv" in clean_text: current_exclusions.append("finserv")
-                            if "housing" in clean_text: current_exclusions.append("housing")
-                            if "logistics" in clean_text: current_exclusions.append("logistics")
-                                
-                            self._emit_update(f"⛔ Rejected: {filename} (Invalid Content)", step_progress + 2, progress_callback)
-                            try:
-                                os.remove(file_path) # Delete the wrong file so it doesn't clutter
-                            except:
-                                pass
-                            rejection_occured = True
-                            
-                    except Exception as e:
-                        print(f" ❌ Error validating {filename}: {e}")
+                        current_exclusions.update(_EXCLUSION_KEYWORDS.findall(clean_text))
+
+                        try:
+                            os.remove(file_path) # Delete the wrong file so it doesn't clutter
+                        except:
+                            pass
+                        rejection_occured = True
 
                 if files_passed_validation and not rejection_occured:
                     self._emit_update(f"📚 Compliance Data Locked: {len(files_passed_validation)} Documents.", 50, progress_callback)
@@ -317,32 +646,57 @@ class ComplianceOrchestrator:
 
                 # If ALL files were rejected, retry with new exclusions.
                 if rejection_occured and not files_passed_validation:
-                    # Remove duplicates from exclusions
-                    current_exclusions = list(set(current_exclusions))
                     attempt += 1
                 else:
                     break
 
             if not specific_files:
                 self._emit_update("❌ Failed to find valid documents. Aborting.", 0, progress_callback)
-                return
+                return None
 
         else:
             # If files WERE provided (manual mode), just process them
             print(f"\n📚 Processing {len(specific_files)} provided documents for {target_company}...")
-            for file_path in specific_files:
-                filename = os.path.basename(file_path)
-                doc_type = "Supporting Document" 
+            doc_inputs = DOC_LIST_ADAPTER.validate_python([
+                {"filename": os.path.basename(fp), "file_path": fp, "doc_type": "Supporting Document"}
+                for fp in specific_files
+            ])
+            for doc_input in doc_inputs:
+                filename = doc_input.filename
+                doc_type = doc_input.doc_type
                 try:
-                    doc_input = DocumentInput(filename=filename, file_path=file_path, doc_type=doc_type)
-                    parse_result = self.parser.parse_document(doc_input)
-                    raw_text = parse_result["content"]
-                    full_consolidated_text += f"\n\n=== SOURCE DOCUMENT: {doc_type} ({filename}) ===\n{raw_text}\n===========================================\n"
+                    raw_text = self._parse_text(doc_input)
+                    text_parts.append(f"\n\n=== SOURCE DOCUMENT: {doc_type} ({filename}) ===\n{raw_text}\n===========================================\n")
                 except:
                     pass
 
+        full_consolidated_text = "".join(text_parts)
+        # The joined string now carries every document: release the parse cache's copies
+        self._parse_cache.clear()
         if len(full_consolidated_text) < 100:
             self._emit_update("❌ Audit Aborted: Insufficient Data.", 0, progress_callback)
+            return None
+        return full_consolidated_text
+
+    def _fetch_financial_truth(self, target_company: str) -> Optional[Dict]:
+        try:
+            return self.hunter.get_financial_truth(target_company)
+        except Exception:
+            print("   ⚠️ Could not fetch API financials.")
+            return None
+
+    @traceable(name="Full Audit Pipeline", run_type="chain")
+    def run_pipeline(self, specific_files: Optional[List[str]] = None, target_company: str = "Consolidated Entity", progress_callback=None):
+        
+        # --- PHASE 0: ARCHIVE CHECK (CACHE-FIRST + FUZZY) ---
+        self._emit_update(f"🔍 Searching local archive for {target_company}...", 2, progress_callback)
+        cached_report = self._check_existing_report(target_company)
+        
+        if cached_report:
+            return self._serve_cached(cached_report, target_company, progress_callback)
+
+        full_consolidated_text = self._gather_text(specific_files, target_company, progress_callback)
+        if full_consolidated_text is None:
             return
 
         # --- STAGE 3: AI ANALYSIS (50-90%) ---
@@ -350,21 +704,20 @@ class ComplianceOrchestrator:
         
         # ATTEMPT FINANCIAL TRUTH ACQUISITION BEFORE AUDIT
         self._emit_update("💰 Fetching Real-time Financial Truth...", 70, progress_callback)
-        try:
-             financial_truth = self.hunter.get_financial_truth(target_company)
-        except Exception:
-             print("   ⚠️ Could not fetch API financials.")
+        financial_truth = self._fetch_financial_truth(target_company)
 
         # PASS EVERYTHING TO THE ENGINE
         self._emit_update("🔍 Running Forensic Cross-Validation...", 80, progress_callback)
         audit_report = self.engine.analyze_document(full_consolidated_text, target_company, financial_truth)
+        del full_consolidated_text  # Multi-MB dump: not held through JSON/PDF/CSV generation
+        return self._finalize_report(audit_report, financial_truth, target_company, progress_callback)
 
+    def _finalize_report(self, audit_report, financial_truth: Optional[Dict], target_company: str, progress_callback=None) -> Dict:
+        """API fallback patching + Stage 4 (JSON, PDF, master CSV). Returns the saved report dict."""
         # 2. LOGIC: Check if Financials are Missing/N/A
         fin = audit_report.api_financials
-        missing_indicators = ["N/A", "Not Disclosed", "0", None, "", "USD 0", "INR 0"]
-        
-        is_revenue_missing = str(fin.revenue).strip() in missing_indicators
-        is_profit_missing = str(fin.net_income).strip() in missing_indicators
+        is_revenue_missing = self._is_missing(fin.revenue)
+        is_profit_missing = self._is_missing(fin.net_income)
 
         if is_revenue_missing or is_profit_missing:
             print(f"   ⚠️ Financials missing in PDF extraction. Triggering API Fallback...")
@@ -374,9 +727,9 @@ class ComplianceOrchestrator:
                     audit_report.api_financials.revenue = str(financial_truth.get('API_Revenue', 'N/A')) + " (Source: API)"
                 if is_profit_missing:
                     audit_report.api_financials.net_income = str(financial_truth.get('API_NetIncome', 'N/A')) + " (Source: API)"
-                if str(fin.ebitda).strip() in missing_indicators:
+                if self._is_missing(fin.ebitda):
                     audit_report.api_financials.ebitda = str(financial_truth.get('API_EBITDA', 'N/A')) + " (Source: API)"
-                if str(fin.employee_cost).strip() in missing_indicators:
+                if self._is_missing(fin.employee_cost):
                     audit_report.api_financials.employee_cost = str(financial_truth.get('API_Employee_Cost', 'N/A')) + " (Source: API)"
                 print("   ✅ Financials successfully patched via External API.")
             else:
@@ -386,32 +739,72 @@ class ComplianceOrchestrator:
         self._emit_update("📊 Generating Strategic PDF Report...", 90, progress_callback)
         safe_name = target_company.replace(" ", "_")
         
-        # Save JSON first
-        self._save_json(audit_report, f"{safe_name}_Consolidated_Report.json")
+        # Flatten once: the same row feeds the merged JSON and the master CSV
+        flat_data = self._flatten_report(audit_report)
+        # Save JSON first (keep the merged dict so callers don't re-read it from disk)
+        report_data = self._save_json(audit_report, f"{safe_name}_Consolidated_Report.json", flat_data=flat_data)
         # Save PDF second
         self._generate_reportlab_pdf(audit_report, f"{safe_name}_Consolidated_Report.pdf")
         # Update Master CSV
-        self._update_master_csv([self._flatten_report(audit_report)])
+        self._update_master_csv([flat_data])
         
         self._emit_update("✅ Audit Complete. Report Ready.", 100, progress_callback)
-        return audit_report
+        return report_data
 
-    def _save_json(self, report, filename):
+    @traceable(name="Batch Audit Pipeline", run_type="chain")
+    def run_pipeline_batch(self, companies: List[str], progress_callback=None) -> Dict[str, Optional[Dict]]:
+        """
+        Multi-company audit (e.g. nightly archive refresh). Ingestion runs per company as in
+        run_pipeline, but every LLM analysis is submitted as ONE Gemini batch job (discounted tier,
+        async turnaround). Archive hits are served directly; aborted companies map to None.
+        """
+        results: Dict[str, Optional[Dict]] = {}
+        pending: Dict[str, tuple] = {}  # company -> (consolidated text, financial truth)
+        
+        for company in companies:
+            self._emit_update(f"🔍 Searching local archive for {company}...", 2, progress_callback)
+            cached_report = self._check_existing_report(company)
+            if cached_report:
+                results[company] = self._serve_cached(cached_report, company, progress_callback)
+                continue
+            
+            full_consolidated_text = self._gather_text(None, company, progress_callback)
+            if full_consolidated_text is None:
+                results[company] = None
+                continue
+            pending[company] = (full_consolidated_text, self._fetch_financial_truth(company))
+        
+        if pending:
+            self._emit_update(f"📦 Submitting {len(pending)} audits as one Gemini batch job...", 80, progress_callback)
+            reports = self.engine.submit_batch(pending)
+            for company, (_, financial_truth) in pending.items():
+                results[company] = self._finalize_report(reports[company], financial_truth, company, progress_callback)
+        
+        return results
+
+    def _save_json(self, report, filename, flat_data: Optional[Dict] = None):
         os.makedirs(self.structured_dir, exist_ok=True)
         path = os.path.join(self.structured_dir, filename)
         
         # 1. Get the standard nested data
         # Handle both Pydantic model and Dict
-        data = report.model_dump() if hasattr(report, 'model_dump') else report
+        data = report.model_dump() if isinstance(report, BaseModel) else report
         
-        # 2. Get the flat data (Business Intel, Labour Code)
-        flat_data = self._flatten_report(report)
+        # 2. Get the flat data (Business Intel, Labour Code), unless the caller already has it
+        if flat_data is None:
+            flat_data = self._flatten_report(report)
         
         # 3. MERGE THEM: This injects keys like 'Labour_Provision' to the top level
         merged_data = {**data, **flat_data}
         
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(merged_data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes directly (no ensure_ascii escaping, same 2-space layout).
+        # Written to a sibling temp file and swapped in, so API readers never see a partial report
+        with tempfile.NamedTemporaryFile("wb", dir=self.structured_dir, suffix=".tmp", delete=False) as f:
+            f.write(orjson.dumps(merged_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(f.name, path)
+        self._file_map_cache = None  # Archive changed; re-list on next lookup
+
+        return merged_data
 
     # --- THE REPORTLAB ENGINE (PROFESSIONAL PDF GENERATION) ---
     def _generate_reportlab_pdf(self, r, filename):
@@ -419,45 +812,34 @@ class ComplianceOrchestrator:
         Generates a professional corporate PDF using ReportLab elements.
         Includes Forensic Business Intelligence and Labour Code Provisions.
         """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, PageBreak
+
         pdf_path = os.path.join(self.structured_dir, filename)
         doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm, topMargin=2*cm, bottomMargin=2*cm)
         
-        # Styles Setup
-        styles = getSampleStyleSheet()
-        
-        # Custom Corporate Styles
-        title_style = ParagraphStyle(
-            'MainTitle', 
-            parent=styles['Heading1'], 
-            fontSize=24, 
-            textColor=colors.HexColor('#0f172a'), 
-            spaceAfter=20
-        )
-        h2_style = ParagraphStyle(
-            'SectionHeader', 
-            parent=styles['Heading2'], 
-            fontSize=14, 
-            textColor=colors.HexColor('#1e40af'), 
-            borderPadding=5, 
-            borderColor=colors.HexColor('#e2e8f0'), 
-            borderWidth=0, 
-            spaceBefore=15, 
-            spaceAfter=10
-        )
-        normal_style = ParagraphStyle(
-            'BodyText', 
-            parent=styles['Normal'], 
-            fontSize=10, 
-            leading=14, 
-            spaceAfter=6
-        )
+        # Styles, static section headers and table styles are process-wide (built on the first PDF)
+        pdf_styles = _pdf_styles()
+        title_style = pdf_styles['title']
+        normal_style = pdf_styles['normal']
+        section_headers = _section_headers()
+        section = lambda key: copy.copy(section_headers[key])
+        table_styles = _table_styles()
         
         elements = []
 
-        # Handle Object vs Dict access
-        c_name = r.company_name if hasattr(r, 'company_name') else r.get('company_name', 'N/A')
-        c_period = r.report_period if hasattr(r, 'report_period') else r.get('report_period', 'N/A')
-        risk_score = r.overall_risk_score if hasattr(r, 'overall_risk_score') else r.get('overall_risk_score', 'N/A')
+        # Handle Object vs Dict access: one type check, every top-level section resolved up front
+        if isinstance(r, BaseModel):
+            c_name, c_period, risk_score = r.company_name, r.report_period, r.overall_risk_score
+            resolved = (getattr(r, key) for key, _ in _PDF_SECTIONS)
+        else:
+            c_name = r.get('company_name', 'N/A')
+            c_period = r.get('report_period', 'N/A')
+            risk_score = r.get('overall_risk_score', 'N/A')
+            resolved = (r.get(key, default) for key, default in _PDF_SECTIONS)
+        (prov, intel, exec_sum, vendors, supply_chain,
+         api_fin, labor_code, workforce_profile, strat_plan) = resolved
 
         # --- 1. Header Section ---
         elements.append(Paragraph(f"Compliance Audit: {c_name}", title_style))
@@ -467,26 +849,19 @@ class ComplianceOrchestrator:
         # Risk Badge Logic
         risk_text = risk_score.upper()
         if "LOW" in risk_text:
-            risk_color = colors.green
+            risk_style = "risk_low"
         elif "MODERATE" in risk_text or "MEDIUM" in risk_text:
-            risk_color = colors.orange
+            risk_style = "risk_moderate"
         else:
-            risk_color = colors.red
+            risk_style = "risk_high"
             
         risk_table = Table([[f"OVERALL RISK: {risk_text}"]], colWidths=[6*cm])
-        risk_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,-1), risk_color), 
-            ('TEXTCOLOR', (0,0), (-1,-1), colors.white), 
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'), 
-            ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-            ('TOPPADDING', (0,0), (-1,-1), 6),
-        ]))
+        risk_table.setStyle(table_styles[risk_style])
         elements.append(risk_table)
         elements.append(Spacer(1, 20))
 
         # --- 2. FORENSIC BUSINESS INTELLIGENCE (NEW) ---
-        elements.append(Paragraph("1. Forensic Business Intelligence", h2_style))
+        elements.append(section("intel"))
         
         # Safe Attribute Access Helper
         def get_val(obj, key, default):
@@ -494,7 +869,6 @@ class ComplianceOrchestrator:
             return getattr(obj, key, default)
 
         # A. Labour Code Impact Box
-        prov = get_val(r, 'labour_code_impact', {})
         # SAFEGUARD: Check if 'prov' exists before accessing attributes
         if prov:
             fiscal_period = get_val(prov, 'fiscal_period', 'Q3 FY26') # Default if missing
@@ -512,16 +886,11 @@ class ComplianceOrchestrator:
             prov_text = "<b>LABOUR CODE FINANCIAL IMPACT:</b><br/><i>No data extracted.</i>"
         
         prov_table = Table([[Paragraph(prov_text, normal_style)]], colWidths=[17*cm])
-        prov_table.setStyle(TableStyle([
-            ('BOX', (0,0), (-1,-1), 1, colors.red), 
-            ('BACKGROUND', (0,0), (-1,-1), colors.HexColor('#fff1f1')), 
-            ('PADDING', (0,0), (-1,-1), 10)
-        ]))
+        prov_table.setStyle(table_styles["provision"])
         elements.append(prov_table)
         elements.append(Spacer(1, 10))
 
         # B. Products & Customers Grid
-        intel = get_val(r, 'business_intel', {})
         # Data preparation with safe fallbacks
         if intel:
             key_products_list = get_val(intel, 'key_products', [])
@@ -534,45 +903,33 @@ class ComplianceOrchestrator:
             major_customers = "Not extracted"
 
         intel_data = [
-            [Paragraph("<b>KEY PRODUCTS</b>", normal_style), Paragraph("<b>MAJOR CUSTOMERS</b>", normal_style)],
+            [section("intel_products"), section("intel_customers")],
             [Paragraph(key_products, normal_style), Paragraph(major_customers, normal_style)]
         ]
         
         intel_table = Table(intel_data, colWidths=[8.5*cm, 8.5*cm])
-        intel_table.setStyle(TableStyle([
-            ('GRID', (0,0), (-1,-1), 0.5, colors.grey), 
-            ('VALIGN', (0,0), (-1,-1), 'TOP'), 
-            ('PADDING', (0,0), (-1,-1), 8),
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#f1f5f9')) # Header row background
-        ]))
+        intel_table.setStyle(table_styles["intel"])
         elements.append(intel_table)
         elements.append(Spacer(1, 15))
 
         # --- 3. Executive Summary Box ---
-        elements.append(Paragraph("2. Executive Summary", h2_style))
+        elements.append(section("summary"))
         
-        exec_sum = get_val(r, 'executive_summary', {})
         overview = get_val(exec_sum, 'overview', 'N/A')
         key_finding = get_val(exec_sum, 'key_finding', 'N/A')
 
         summary_content = f"<b>Overview:</b> {overview}<br/><br/><b>💡 Key Insight:</b> {key_finding}"
         summary_table = Table([[Paragraph(summary_content, normal_style)]], colWidths=[17*cm])
-        summary_table.setStyle(TableStyle([
-            ('BOX', (0,0), (-1,-1), 1, colors.HexColor('#cbd5e1')),
-            ('BACKGROUND', (0,0), (-1,-1), colors.HexColor('#f8fafc')),
-            ('PADDING', (0,0), (-1,-1), 12),
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-        ]))
+        summary_table.setStyle(table_styles["summary"])
         elements.append(summary_table)
         elements.append(Spacer(1, 15))
 
         # --- 4. Supply Chain & Vendor Intelligence ---
-        elements.append(Paragraph("3. Supply Chain & Vendor Intelligence", h2_style))
+        elements.append(section("supply_chain"))
         
         # Vendor List Table
-        vendors = get_val(r, 'vendors', [])
         if vendors and len(vendors) > 0:
-            elements.append(Paragraph("<b>Key Vendors Identified (Related Parties):</b>", normal_style))
+            elements.append(section("vendors_caption"))
             
             # Format vendor list as a table for better readability
             vendor_data = []
@@ -580,35 +937,25 @@ class ComplianceOrchestrator:
                 vendor_data.append([f"{i+1}.", v])
             
             vendor_table = Table(vendor_data, colWidths=[1*cm, 16*cm])
-            vendor_table.setStyle(TableStyle([
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('PADDING', (0,0), (-1,-1), 2),
-                ('TEXTCOLOR', (0,0), (-1,-1), colors.HexColor('#334155')),
-            ]))
+            vendor_table.setStyle(table_styles["vendors"])
             elements.append(vendor_table)
         else:
-            elements.append(Paragraph("<i>No specific vendor names extracted from available documents.</i>", normal_style))
+            elements.append(section("vendors_empty"))
         
         elements.append(Spacer(1, 10))
 
         # Liability Box
-        supply_chain = get_val(r, 'supply_chain_compliance', {})
         liability_val = get_val(supply_chain, 'principal_employer_liability', 'N/A')
 
         liability_text = f"<b>Principal Employer Liability Analysis:</b> {liability_val}"
         liability_table = Table([[Paragraph(liability_text, normal_style)]], colWidths=[17*cm])
-        liability_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,-1), colors.HexColor('#fff1f2')), # Light Red
-            ('BOX', (0,0), (-1,-1), 1, colors.HexColor('#fda4af')),
-            ('PADDING', (0,0), (-1,-1), 8),
-        ]))
+        liability_table.setStyle(table_styles["liability"])
         elements.append(liability_table)
         elements.append(Spacer(1, 15))
 
         # --- 5. Financial Grid ---
-        elements.append(Paragraph("4. Financial Intelligence", h2_style))
+        elements.append(section("financials"))
         
-        api_fin = get_val(r, 'api_financials', {})
         
         # Header Row
         fin_data = [['Revenue', 'EBITDA', 'Net Income', 'Emp. Cost']]
@@ -621,82 +968,62 @@ class ComplianceOrchestrator:
         ])
         
         fin_table = Table(fin_data, colWidths=[4.25*cm]*4)
-        fin_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0f172a')), # Header Blue
-            ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 10),
-            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-            ('PADDING', (0,0), (-1,-1), 8),
-            ('BACKGROUND', (0,1), (-1,-1), colors.white), # Data White
-            ('TEXTCOLOR', (0,1), (-1,-1), colors.black),
-        ]))
+        fin_table.setStyle(table_styles["financials"])
         elements.append(fin_table)
         elements.append(Spacer(1, 15))
 
         # --- 6. Labour Code Analysis (Reusable Table Builder) ---
-        def build_compliance_section(title, data_obj):
-            elements.append(Paragraph(title, h2_style))
+        def evidence_cell(evidence_text):
+            # Missing evidence is a short fixed string: Table draws it directly, no Paragraph needed
+            if evidence_text in ("N/A", "", None):
+                return "N/A"
+            if len(evidence_text) > 300: evidence_text = evidence_text[:300] + "..."
+            return Paragraph(evidence_text, normal_style)
+
+        def build_compliance_section(code_key, data_obj):
+            elements.append(section(f"code_{code_key}"))
             
             # Table Header
             table_data = [['Area', 'Status', 'Evidence Snippet']]
             
             # Helper to process Pydantic models
-            data_dict = data_obj.model_dump() if hasattr(data_obj, 'model_dump') else data_obj
-            
-            if not data_dict: return
+            data_dict = data_obj.model_dump() if isinstance(data_obj, BaseModel) else (data_obj or {})
 
             for key, val in data_dict.items():
                 if isinstance(val, dict) and 'status' in val:
                     # Clean up Key Name
-                    clean_key = key.replace('_', ' ').replace('status', '').strip().title()
+                    clean_key = _area_label(key)
                     
                     # Status Color Logic (Text Color)
                     status_text = val['status'].upper()
-                    status_para_style = ParagraphStyle('StatusStyle', parent=styles['Normal'], fontSize=9, fontName='Helvetica-Bold')
                     
+                    # Colour lives on the prebuilt style, so no <font> markup is parsed per cell
                     if "COMPLIANT" in status_text:
-                        status_para = Paragraph(f"<font color='green'>{status_text}</font>", status_para_style)
+                        status_para_style = pdf_styles['status_green']
                     elif "RISK" in status_text or "NON" in status_text:
-                        status_para = Paragraph(f"<font color='red'>{status_text}</font>", status_para_style)
+                        status_para_style = pdf_styles['status_red']
                     else:
-                        status_para = Paragraph(f"<font color='orange'>{status_text}</font>", status_para_style)
+                        status_para_style = pdf_styles['status_orange']
+                    status_para = Paragraph(status_text, status_para_style)
 
-                    # Evidence Text
-                    evidence_text = val.get('evidence_snippet', 'N/A')
-                    if len(evidence_text) > 300: evidence_text = evidence_text[:300] + "..."
-                    evidence_para = Paragraph(evidence_text, normal_style)
-                    
-                    table_data.append([clean_key, status_para, evidence_para])
+                    table_data.append([clean_key, status_para, evidence_cell(val.get('evidence_snippet'))])
 
             if len(table_data) > 1:
-                t = Table(table_data, colWidths=[4*cm, 3.5*cm, 9.5*cm])
-                t.setStyle(TableStyle([
-                    ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#e2e8f0')), # Header Grey
-                    ('TEXTCOLOR', (0,0), (-1,0), colors.black),
-                    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                    ('INNERGRID', (0,0), (-1,-1), 0.25, colors.lightgrey),
-                    ('BOX', (0,0), (-1,-1), 0.5, colors.grey),
-                    ('PADDING', (0,0), (-1,-1), 6),
-                ]))
+                # LongTable: row-splitting tuned for tall grids; header row repeats on each page
+                t = LongTable(table_data, colWidths=[4*cm, 3.5*cm, 9.5*cm], repeatRows=1)
+                t.setStyle(table_styles["compliance"])
                 elements.append(t)
                 elements.append(Spacer(1, 10))
 
         # Add Sections
-        labor_code = get_val(r, 'labor_code_analysis', {})
         if labor_code:
-            build_compliance_section("5A. Wages & Remuneration", get_val(labor_code, 'wages', {}))
-            build_compliance_section("5B. OSH & Safety", get_val(labor_code, 'osh', {}))
-            build_compliance_section("5C. Industrial Relations", get_val(labor_code, 'ir', {}))
-            build_compliance_section("5D. Social Security", get_val(labor_code, 'social_security', {}))
+            for code_key in ("wages", "osh", "ir", "social_security"):
+                build_compliance_section(code_key, get_val(labor_code, code_key, {}))
 
         elements.append(PageBreak()) # New Page
 
         # --- 7. Workforce Profile ---
-        elements.append(Paragraph("6. Workforce Profile", h2_style))
-        workforce_profile = get_val(r, 'workforce_profile', [])
+        elements.append(section("workforce"))
         
         if workforce_profile:
             wf_data = [['Category', 'Total', 'Male', 'Female', 'Turnover']]
@@ -709,26 +1036,17 @@ class ComplianceOrchestrator:
                     get_val(w, 'turnover_rate', 'N/A')
                 ])
             
-            wf_table = Table(wf_data, colWidths=[6*cm, 2.5*cm, 2.5*cm, 2.5*cm, 3.5*cm])
-            wf_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#1e40af')),
-                ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('ALIGN', (1,0), (-1,-1), 'RIGHT'), # Numbers aligned right
-                ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                ('PADDING', (0,0), (-1,-1), 6),
-                ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.whitesmoke, colors.white]),
-            ]))
+            wf_table = LongTable(wf_data, colWidths=[6*cm, 2.5*cm, 2.5*cm, 2.5*cm, 3.5*cm], repeatRows=1)
+            wf_table.setStyle(table_styles["workforce"])
             elements.append(wf_table)
         else:
-            elements.append(Paragraph("No detailed workforce data extracted.", normal_style))
+            elements.append(section("workforce_empty"))
         
         elements.append(Spacer(1, 15))
 
         # --- 8. Strategic Recommendations ---
-        elements.append(Paragraph("7. Strategic Recommendations", h2_style))
+        elements.append(section("strategy"))
         
-        strat_plan = get_val(r, 'strategic_plan', {})
         recommendations = get_val(strat_plan, 'recommendations', [])
 
         if recommendations:
@@ -737,16 +1055,12 @@ class ComplianceOrchestrator:
                 rec_data.append([f"{i}.", Paragraph(rec, normal_style)])
             
             rec_table = Table(rec_data, colWidths=[1*cm, 16*cm])
-            rec_table.setStyle(TableStyle([
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('PADDING', (0,0), (-1,-1), 4),
-            ]))
+            rec_table.setStyle(table_styles["recommendations"])
             elements.append(rec_table)
 
         # Footer
         elements.append(Spacer(1, 30))
-        elements.append(Paragraph("Generated by SANE-AI AutoLabor Agent • Forensic Audit Protocol", 
-            ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey, alignment=TA_CENTER)))
+        elements.append(section("footer"))
 
         # Build PDF
         try:
@@ -755,76 +1069,108 @@ class ComplianceOrchestrator:
         except Exception as e:
             print(f"   ❌ ReportLab Generation Failed: {e}")
 
+    @staticmethod
+    def _walk(node, path, default):
+        """Follows keys/indices into a nested report; missing or None at any step -> default"""
+        try:
+            for key in path:
+                node = node[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+        return default if node is None else node
+
     def _flatten_report(self, report):
         # Handle both Pydantic model and Dict
         if isinstance(report, dict):
             # If it's already a flat dict (from CSV read), return it
             if "Labour_Provision" in report:
                 return report
-            
-            # If it's a nested dict (from JSON load), flatten it manually
             r = report
-            labour_impact = r.get("labour_code_impact") or {}
-            biz_intel = r.get("business_intel") or {}
-            
-            # Helper for safe nested access
-            def safe_get(d, keys, default="N/A"):
-                for k in keys:
-                    if isinstance(d, dict): d = d.get(k, {})
-                    else: return default
-                return d if isinstance(d, str) else default
-
-            return {
-                "Company": r.get("company_name", "N/A"),
-                "Period": r.get("report_period", "N/A"),
-                "Risk Score": r.get("overall_risk_score", "N/A"),
-                
-                "Labour_Provision": labour_impact.get("provision_amount", "N/A"),
-                "Labour_Provision_Desc": labour_impact.get("impact_description", "N/A"),
-                "Top_Products": ", ".join(biz_intel.get("key_products", [])),
-                "Major_Customers": ", ".join(biz_intel.get("major_customers", [])),
-                "Top_Vendors": ", ".join((r.get("vendors") or [])[:5]),
-                
-                "Wage_Status": safe_get(r, ["labor_code_analysis", "wages", "minimum_wage_status", "status"]),
-                "Health_Status": safe_get(r, ["labor_code_analysis", "osh", "safety_systems_status", "status"]),
-                "Strike_Risk": safe_get(r, ["labor_code_analysis", "ir", "disputes_strikes_status", "status"]),
-                
-                "Workforce_Turnover": r.get("workforce_profile", [{}])[0].get("turnover_rate", "N/A") if r.get("workforce_profile") else "N/A",
-                "Strategic_Action": r.get("strategic_plan", {}).get("recommendations", ["N/A"])[0]
-            }
-            
-        # Pydantic Model Path
-        r = report.model_dump()
-        labour = r.get("labour_code_impact") or {}
-        biz = r.get("business_intel") or {}
-        
-        return {
-            "Company": r["company_name"],
-            "Period": r["report_period"],
-            "Risk Score": r["overall_risk_score"],
-            
-            # --- MAPS DIRECTLY TO FRONTEND KEYS ---
-            "Labour_Provision": labour.get("provision_amount", "N/A"),
-            "Labour_Provision_Desc": labour.get("impact_description", "N/A"),
-            "Top_Products": ", ".join(biz.get("key_products", [])),
-            "Major_Customers": ", ".join(biz.get("major_customers", [])),
-            "Top_Vendors": ", ".join((r.get("vendors") or [])[:5]),
-            "Wage_Status": r["labor_code_analysis"]["wages"]["minimum_wage_status"]["status"],
-            "Health_Status": r["labor_code_analysis"]["osh"]["safety_systems_status"]["status"],
-            "Strike_Risk": r["labor_code_analysis"]["ir"]["disputes_strikes_status"]["status"],
-            "Workforce_Turnover": r["workforce_profile"][0]["turnover_rate"] if r["workforce_profile"] else "N/A",
-            "Strategic_Action": r["strategic_plan"]["recommendations"][0] if r["strategic_plan"]["recommendations"] else "N/A"
-        }
+        else:
+            r = report.model_dump()
+
+        # One schema walk serves both nested dicts (from JSON load) and dumped models
+        flat = {}
+        for column, path, default in _FLATTEN_SCHEMA:
+            value = self._walk(r, path, default)
+            if column in _FLATTEN_JOINED:
+                value = ", ".join(value[:_FLATTEN_JOINED[column]])
+            flat[column] = value
+        return flat
+
+    @staticmethod
+    def _master_key(company, period) -> str:
+        return "\x1f".join("" if v is None else str(v) for v in (company, period))
+
+    def _scan_master_csv(self, csv_path: str):
+        """Header and (Company, Period) keys straight from the CSV text, without pandas"""
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            company_col, period_col = header.index("Company"), header.index("Period")
+            keys = [self._master_key(row[company_col], row[period_col]) for row in reader if row]
+        return header, keys
+
+    def _load_master_index(self, csv_path: str, index_path: str):
+        """Sidecar index if it still describes the CSV on disk (same mtime + size), else a fresh scan"""
+        stat = os.stat(csv_path)
+        try:
+            with open(index_path, "rb") as f:
+                index = orjson.loads(f.read())
+            if index.get("stamp") == [stat.st_mtime_ns, stat.st_size]:
+                return index["header"], index["keys"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+        return self._scan_master_csv(csv_path)
+
+    def _save_master_index(self, csv_path: str, index_path: str, header: List[str], keys):
+        stat = os.stat(csv_path)
+        with tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(index_path), suffix=".tmp", delete=False) as f:
+            f.write(orjson.dumps({"stamp": [stat.st_mtime_ns, stat.st_size], "header": header, "keys": sorted(keys)}))
+        os.replace(f.name, index_path)
 
     def _update_master_csv(self, new_results: List[Dict]):
         if not new_results: return
-        csv_path = os.path.join(self.structured_dir, "Master_Compliance_Tracker.csv")
-        new_df = pd.DataFrame(new_results)
-        
-        if os.path.exists(csv_path):
-            existing_df = pd.read_csv(csv_path)
-            combined = pd.concat([existing_df, new_df]).drop_duplicates(subset=["Company", "Period"], keep='last')
-            combined.to_csv(csv_path, index=False)
-        else:
-            new_df.to_csv(csv_path, index=False)
-        print(f"   📊 Master CSV Updated.")
\ No newline at end of file
+        csv_path = os.path.join(self.structured_dir, MASTER_CSV_FILE)
+        index_path = os.path.join(self.structured_dir, MASTER_INDEX_FILE)
+        new_keys = [self._master_key(row.get("Company"), row.get("Period")) for row in new_results]
+
+        with _MASTER_CSV_LOCK:
+            if os.path.exists(csv_path):
+                try:
+                    header, known_keys = self._load_master_index(csv_path, index_path)
+                except (ValueError, OSError):
+                    header, known_keys = [], []  # Unreadable layout: fall through to the full rewrite
+
+                # Fast path: only new (Company, Period) pairs and no new columns -> append the rows
+                known_keys = set(known_keys)
+                appendable = (
+                    header
+                    and len(set(new_keys)) == len(new_keys)
+                    and known_keys.isdisjoint(new_keys)
+                    and all(col in header for row in new_results for col in row)
+                )
+                if appendable:
+                    with open(csv_path, "a", encoding="utf-8", newline="") as f:
+                        csv.DictWriter(f, fieldnames=header, lineterminator="\n").writerows(new_results)
+                    self._save_master_index(csv_path, index_path, header, known_keys.union(new_keys))
+                    print(f"   📊 Master CSV Updated.")
+                    return
+
+                # Overwrite of an existing pair (or a schema change): drop the superseded rows by key
+                # membership (hash lookup of the few new keys) instead of deduplicating the whole table
+                key_cols = ["Company", "Period"]
+                new_df = pd.DataFrame(new_results).drop_duplicates(subset=key_cols, keep='last')
+                existing_df = pd.read_csv(csv_path)
+                superseded = pd.MultiIndex.from_frame(existing_df[key_cols]).isin(pd.MultiIndex.from_frame(new_df[key_cols]))
+                combined = pd.concat([existing_df[~superseded], new_df])
+                combined.to_csv(csv_path, index=False)
+            else:
+                # First report(s): plain csv module, same layout pandas would write (columns in first-seen order)
+                fieldnames = list(dict.fromkeys(col for row in new_results for col in row))
+                with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+                    writer.writeheader()
+                    writer.writerows(new_results)
+            self._save_master_index(csv_path, index_path, *self._scan_master_csv(csv_path))
+            print(f"   📊 Master CSV Updated.")
\ No newline at end of file
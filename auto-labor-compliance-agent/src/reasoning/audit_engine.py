@@ -1,7 +1,50 @@
 import os
+import time
+import asyncio
+import bisect
+import itertools
+import re
 from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel, Field
-from typing import Optional, List, Literal, Dict, Any
+from typing import Optional, List, Literal, Dict, Any, Tuple
+
+from src.reasoning.audit_pillars import ANCHOR_PHRASES  # Lowercase phrases the prompt hunts for
+
+try:
+    from google import genai  # Optional: Gemini Batch API for multi-company audits
+except ImportError:
+    genai = None
+
+try:
+    import ahocorasick  # Optional: single-pass anchor scan over long prompt dumps
+except ImportError:
+    ahocorasick = None
+
+BATCH_POLL_SECONDS = 30
+BATCH_MAX_WAIT_SECONDS = 24 * 3600  # Batch API turnaround target; past this, cancel and audit live
+BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+ANALYZE_MAX_CONCURRENCY = 8  # In-flight Gemini audits when several companies run outside the Batch API
+
+# Prompt context budget: longer dumps keep only paragraphs near the phrases the prompt hunts for
+PROMPT_CONTEXT_CHARS = 200_000
+FULL_CONTEXT_CHARS = 1_500_000  # Old head-slice cap, still used when no anchor is found
+ANCHOR_WINDOW = 2  # Paragraphs kept on each side of an anchor hit
+SOURCE_HEADER_PARAS = 3  # Paragraphs kept after each "=== SOURCE DOCUMENT" marker (name, period)
+_ANCHORS = re.compile("|".join(map(re.escape, ANCHOR_PHRASES)))
+
+
+def _build_anchor_automaton():
+    """Aho-Corasick automaton over ANCHOR_PHRASES (about 4x faster than the regex on multi-MB dumps)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in ANCHOR_PHRASES:
+        automaton.add_word(phrase, len(phrase))
+    automaton.make_automaton()
+    return automaton
+
+
+_ANCHOR_AUTOMATON = _build_anchor_automaton()
 
 # --- 1. Data Schemas (Fully Aligned with Pipeline) ---
 
@@ -111,21 +154,114 @@ class AuditEngine:
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key: raise ValueError("❌ Missing GOOGLE_API_KEY")
         
+        self.model_name = model_name
+        self.api_key = api_key
         self.llm = ChatGoogleGenerativeAI(
             model=model_name,
             temperature=0.0,
             google_api_key=api_key
         )
+        # Schema -> structured-output binding is derived once; the runnable is stateless and shared
+        self.structured_llm = self.llm.with_structured_output(AuditReport)
 
     def analyze_document(self, text_content: str, filename: str, financial_data: dict = None) -> AuditReport:
         """
         Analyzes the FULL consolidated text in one shot using the Multi-Vector Forensic Protocol.
         """
-        print(f"   🧠 AI Auditor: Analyzing {filename} using 'Forensic-Lock' Protocol...")
+        prompt, early_report = self._prepare_analysis(text_content, filename)
+        if early_report is not None:
+            return early_report
         
+        try:
+            # 1. Run AI Analysis
+            report = self.structured_llm.invoke(prompt)
+            return self._postprocess(report, financial_data)
+
+        except Exception as e:
+            return self._failed_report(filename, e)
+
+    async def analyze_document_async(self, text_content: str, filename: str, financial_data: dict = None) -> AuditReport:
+        """Same protocol as analyze_document, awaiting Gemini so several audits can be in flight"""
+        prompt, early_report = self._prepare_analysis(text_content, filename)
+        if early_report is not None:
+            return early_report
+
+        try:
+            report = await self.structured_llm.ainvoke(prompt)
+            return self._postprocess(report, financial_data)
+        except Exception as e:
+            return self._failed_report(filename, e)
+
+    def _prepare_analysis(self, text_content: str, filename: str) -> Tuple[Optional[str], Optional[AuditReport]]:
+        """Shared preamble of both analyze paths: (prompt, None), or (None, placeholder report) for thin dumps"""
+        print(f"   🧠 AI Auditor: Analyzing {filename} using 'Forensic-Lock' Protocol...")
+
         if len(text_content) < 500:
-            return self._get_dummy_report(filename, "Insufficient Data")
+            return None, self._get_dummy_report(filename, "Insufficient Data")
+        return self._build_prompt(text_content, filename), None
+
+    def _failed_report(self, filename: str, error: Exception) -> AuditReport:
+        print(f"   ❌ AI Reasoning Failed: {error}")
+        return self._get_dummy_report(filename, str(error))
+
+    def analyze_documents(self, jobs: Dict[str, Tuple[str, Optional[dict]]]) -> Dict[str, AuditReport]:
+        """
+        Runs one live audit per company concurrently (bounded by ANALYZE_MAX_CONCURRENCY).
+        jobs: {company: (consolidated text, financial truth)}. Call from a thread without a running event loop.
+        """
+        async def run_all():
+            sem = asyncio.Semaphore(ANALYZE_MAX_CONCURRENCY)
+
+            async def bounded(company):
+                text_content, financial_data = jobs[company]
+                async with sem:
+                    return await self.analyze_document_async(text_content, company, financial_data)
 
+            companies = list(jobs)
+            results = await asyncio.gather(*(bounded(c) for c in companies))
+            return dict(zip(companies, results))
+
+        return asyncio.run(run_all())
+
+    @staticmethod
+    def _focus_context(text_content: str) -> str:
+        """
+        Dumps within PROMPT_CONTEXT_CHARS go in whole. Longer ones keep each source header plus
+        the paragraphs within ANCHOR_WINDOW of an anchor phrase, in document order, capped at the budget.
+        """
+        if len(text_content) <= PROMPT_CONTEXT_CHARS:
+            return text_content
+
+        paragraphs = text_content.split("\n\n")
+        starts = list(itertools.accumulate((len(p) + 2 for p in paragraphs[:-1]), initial=0))
+        keep = [False] * len(paragraphs)
+
+        def mark(lo: int, hi: int):
+            lo = max(0, lo)
+            keep[lo:hi] = [True] * len(keep[lo:hi])
+
+        # One scan of the lowercased dump (case-sensitive matching is far faster than re.I)
+        lowered = text_content.lower()
+        if _ANCHOR_AUTOMATON is not None:
+            offsets = (end - length + 1 for end, length in _ANCHOR_AUTOMATON.iter(lowered))
+        else:
+            offsets = (m.start() for m in _ANCHORS.finditer(lowered))
+        hits = {bisect.bisect_right(starts, offset) - 1 for offset in offsets}
+        if not hits:
+            return text_content[:FULL_CONTEXT_CHARS]
+        for i in hits:
+            mark(i - ANCHOR_WINDOW, i + ANCHOR_WINDOW + 1)
+
+        pos = text_content.find("=== SOURCE DOCUMENT")
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            mark(i, i + 1 + SOURCE_HEADER_PARAS)
+            pos = text_content.find("=== SOURCE DOCUMENT", pos + 1)
+
+        focused = "\n\n".join(para for para, kept in zip(paragraphs, keep) if kept)
+        return focused[:PROMPT_CONTEXT_CHARS]
+
+    def _build_prompt(self, text_content: str, filename: str) -> str:
         # --- THE MULTI-VECTOR FORENSIC PROMPT ---
         # Designed to search Financials AND BRSR Sustainability data simultaneously.
         prompt = f"""
@@ -162,43 +298,98 @@ class AuditEngine:
         --- **OUTPUT FORMAT** ---
         Return a valid JSON matching the `AuditReport` schema.
         
-        **INPUT CONTEXT (First 1.5M chars):**
-        {text_content[:1500000]} 
+        **INPUT CONTEXT (Forensic excerpts around the sections above):**
+        {self._focus_context(text_content)} 
         """
-        
-        structured_llm = self.llm.with_structured_output(AuditReport)
-        
-        try:
-            # 1. Run AI Analysis
-            report = structured_llm.invoke(prompt)
-
-            # 2. SMART API PATCHING (Only if AI fails)
-            if financial_data:
-                ai_rev = report.api_financials.revenue
-                ai_pat = report.api_financials.net_income
-                
-                # Only patch if AI returned N/A, None, or 0
-                if ai_rev in ["N/A", "0", None, ""]:
-                    report.api_financials.revenue = str(financial_data.get('API_Revenue', 'N/A')) + " (API)"
-                
-                if report.api_financials.ebitda in ["N/A", "0", None, ""]:
-                    report.api_financials.ebitda = str(financial_data.get('API_EBITDA', 'N/A')) + " (API)"
-
-                if ai_pat in ["N/A", "0", None, ""]:
-                    report.api_financials.net_income = str(financial_data.get('API_NetIncome', 'N/A')) + " (API)"
-                
-                if report.api_financials.employee_cost in ["N/A", "0", None, ""]:
-                    report.api_financials.employee_cost = str(financial_data.get('API_Employee_Cost', 'N/A')) + " (API)"
+        return prompt
+
+    def _postprocess(self, report: AuditReport, financial_data: dict = None) -> AuditReport:
+        # 2. SMART API PATCHING (Only if AI fails)
+        if financial_data:
+            ai_rev = report.api_financials.revenue
+            ai_pat = report.api_financials.net_income
             
-            # 3. Vendor Safety Net
-            if not report.vendors:
-                 report.vendors = ["Refer to Annual Report Note: Related Party Disclosures"]
+            # Only patch if AI returned N/A, None, or 0
+            if ai_rev in ["N/A", "0", None, ""]:
+                report.api_financials.revenue = str(financial_data.get('API_Revenue', 'N/A')) + " (API)"
             
-            return report
+            if report.api_financials.ebitda in ["N/A", "0", None, ""]:
+                report.api_financials.ebitda = str(financial_data.get('API_EBITDA', 'N/A')) + " (API)"
 
+            if ai_pat in ["N/A", "0", None, ""]:
+                report.api_financials.net_income = str(financial_data.get('API_NetIncome', 'N/A')) + " (API)"
+            
+            if report.api_financials.employee_cost in ["N/A", "0", None, ""]:
+                report.api_financials.employee_cost = str(financial_data.get('API_Employee_Cost', 'N/A')) + " (API)"
+        
+        # 3. Vendor Safety Net
+        if not report.vendors:
+             report.vendors = ["Refer to Annual Report Note: Related Party Disclosures"]
+        
+        return report
+
+    def submit_batch(self, jobs: Dict[str, Tuple[str, Optional[dict]]]) -> Dict[str, AuditReport]:
+        """
+        Runs many audits as ONE Gemini Batch API job (half-price tier, async turnaround).
+        jobs: {company: (consolidated text, financial truth)}. Polls until the job finishes or
+        BATCH_MAX_WAIT_SECONDS pass (the job is then cancelled).
+        Falls back to concurrent live calls (analyze_documents) when google-genai isn't installed
+        or the batch job fails.
+        """
+        reports: Dict[str, AuditReport] = {}
+        batchable = {}
+        for company, (text_content, _) in jobs.items():
+            if len(text_content) < 500:
+                reports[company] = self._get_dummy_report(company, "Insufficient Data")
+            else:
+                batchable[company] = text_content
+        if not batchable:
+            return reports
+
+        if genai is None:
+            print("   ⚠️ google-genai not installed: running batch audits as concurrent live calls.")
+            reports.update(self.analyze_documents({c: jobs[c] for c in batchable}))
+            return reports
+
+        # Structured output enforced by the response schema (inline requests keep submission order)
+        companies = list(batchable)
+        batch_requests = [
+            {
+                "contents": [{"role": "user", "parts": [{"text": self._build_prompt(batchable[c], c)}]}],
+                "config": {"temperature": 0.0, "response_mime_type": "application/json", "response_schema": AuditReport},
+            }
+            for c in companies
+        ]
+
+        try:
+            client = genai.Client(api_key=self.api_key)
+            job = client.batches.create(model=self.model_name, src=batch_requests, config={"display_name": "sane-ai-audit-batch"})
+            print(f"   📦 Gemini batch job submitted: {job.name} ({len(batch_requests)} audits)")
+            deadline = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+            while job.state.name not in BATCH_DONE_STATES:
+                if time.monotonic() >= deadline:
+                    client.batches.cancel(name=job.name)
+                    raise TimeoutError(f"Batch job still {job.state.name} after {BATCH_MAX_WAIT_SECONDS}s")
+                time.sleep(BATCH_POLL_SECONDS)
+                job = client.batches.get(name=job.name)
+            if job.state.name != "JOB_STATE_SUCCEEDED":
+                raise RuntimeError(f"Batch job ended in {job.state.name}")
+            responses = job.dest.inlined_responses
         except Exception as e:
-            print(f"   ❌ AI Reasoning Failed: {e}")
-            return self._get_dummy_report(filename, str(e))
+            print(f"   ❌ Batch Inference Failed ({e}). Falling back to concurrent live audits.")
+            reports.update(self.analyze_documents({c: jobs[c] for c in companies}))
+            return reports
+
+        for company, item in zip(companies, responses):
+            try:
+                if item.error:
+                    raise RuntimeError(item.error)
+                report = AuditReport.model_validate_json(item.response.text)
+                reports[company] = self._postprocess(report, jobs[company][1])
+            except Exception as e:
+                print(f"   ❌ AI Reasoning Failed for {company}: {e}")
+                reports[company] = self._get_dummy_report(company, str(e))
+        return reports
 
     def _get_dummy_report(self, filename, error_msg):
         dummy_ev = Evidence(status="Gap", evidence_snippet=error_msg, source_ref="System")
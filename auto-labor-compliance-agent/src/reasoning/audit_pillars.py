@@ -1 +1,12 @@
-# Logic for Wages, Safety, Workforce pillars
\ No newline at end of file
+# Logic for Wages, Safety, Workforce pillars
+
+# Lowercase phrases the audit hunts for across the pillars. Shared by the prompt focuser
+# (audit_engine) and the bounded PDF conversion (pdf_parser), so neither drops what the other reads
+ANCHOR_PHRASES = (
+    "labour code", "labor code", "provision for gratuity", "one-time charge", "exceptional item",
+    "notes to financial results", "management discussion", "press release", "about us",
+    "employees and workers", "permanent employees", "turnover rate", "ratio of remuneration",
+    "median remuneration", "related party", "iso 45001", "ltifr", "fatalit", "collective bargaining",
+    "trade union", "strike", "lockout", "parental leave", "provident fund", "forced labour", "forced labor",
+    "child labour", "child labor", "conflict mineral",
+)
@@ -1,15 +1,21 @@
 # File: src/tools/web_search.py
 import os
+import functools
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.tools import tool
 
+@functools.lru_cache(maxsize=None)
+def _tavily(max_results: int) -> TavilySearchResults:
+    """One Tavily client per result size, built on first use and shared by every tool call"""
+    return TavilySearchResults(max_results=max_results)
+
 class WebSearchTool:
     def __init__(self):
         # Ensure TAVILY_API_KEY is in your .env
         if not os.getenv("TAVILY_API_KEY"):
             print("⚠️ Warning: TAVILY_API_KEY not found. Search will fail.")
         
-        self.search = TavilySearchResults(max_results=3)
+        self.search = _tavily(3)
 
     @tool("corporate_doc_hunter")
     def hunt_documents(query: str):
@@ -18,8 +24,7 @@ class WebSearchTool:
         for Indian Automotive companies.
         Useful for finding: "ROA ROE impact labor code", "Mahindra Annual Report 2025 pdf".
         """
-        search_engine = TavilySearchResults(max_results=5)
-        return search_engine.invoke(query)
+        return _tavily(5).invoke(query)
 
     @tool("labour_code_impact_search")
     def search_impact_params(parameter: str):
@@ -27,5 +32,4 @@ class WebSearchTool:
         Search for specific labor code impacts like 'Gratuity increase', 
         'OSHWC medical checkup rules', or 'Fixed Term Employment notifications'.
         """
-        search_engine = TavilySearchResults(max_results=3)
-        return search_engine.invoke(f"India Labour Code impact on {parameter} 2025")
\ No newline at end of file
+        return _tavily(3).invoke(f"India Labour Code impact on {parameter} 2025")
\ No newline at end of file
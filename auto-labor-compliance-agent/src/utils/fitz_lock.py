@@ -0,0 +1,4 @@
+# PyMuPDF (fitz) is not thread-safe: every fitz call made from worker threads holds this lock
+import threading
+
+FITZ_LOCK = threading.Lock()
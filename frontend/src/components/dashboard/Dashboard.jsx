@@ -186,50 +186,54 @@ const Dashboard = () => {
         };
 
         ws.onmessage = async (event) => {
-            const data = JSON.parse(event.data);
-            
-            // Update Local State (Wheel Animation)
-            if (data.progress) setProgress(data.progress);
-            if (data.message) setWsStatus(data.message);
-
-            // Update Global Context (Syncs Runner Bar)
-            if (typeof setRunner === 'function') {
-                setRunner(prev => ({ 
-                    ...prev, 
-                    progress: data.progress, 
-                    progressMsg: data.message 
-                }));
-            }
+            // Backend batches bursts of updates into a single JSON array frame
+            const payload = JSON.parse(event.data);
+            const messages = Array.isArray(payload) ? payload : [payload];
+
+            for (const data of messages) {
+                // Update Local State (Wheel Animation)
+                if (data.progress) setProgress(data.progress);
+                if (data.message) setWsStatus(data.message);
+
+                // Update Global Context (Syncs Runner Bar)
+                if (typeof setRunner === 'function') {
+                    setRunner(prev => ({ 
+                        ...prev, 
+                        progress: data.progress, 
+                        progressMsg: data.message 
+                    }));
+                }
 
-            // Handle Completion
-            if (data.status === "completed") {
-                ws.close();
+                // Handle Completion
+                if (data.status === "completed") {
+                    ws.close();
                 
-                // If backend sent data directly (Optimization)
-                if (data.report_data) {
-                    if (typeof setViewer === 'function') setViewer(data.report_data);
-                    if (typeof setRunner === 'function') setRunner({ status: 'COMPLETED', company: companyName });
-                } 
-                // Fallback: Fetch if data missing
-                else {
-                    try {
-                        const result = await auditService.fetchReport(companyName);
-                        if (result.status === 'success') {
-                            setViewer(result.data);
-                            setRunner({ status: 'COMPLETED', company: companyName });
-                        } else {
-                            throw new Error("Report fetch failed");
+                    // If backend sent data directly (Optimization)
+                    if (data.report_data) {
+                        if (typeof setViewer === 'function') setViewer(data.report_data);
+                        if (typeof setRunner === 'function') setRunner({ status: 'COMPLETED', company: companyName });
+                    } 
+                    // Fallback: Fetch if data missing
+                    else {
+                        try {
+                            const result = await auditService.fetchReport(companyName);
+                            if (result.status === 'success') {
+                                setViewer(result.data);
+                                setRunner({ status: 'COMPLETED', company: companyName });
+                            } else {
+                                throw new Error("Report fetch failed");
+                            }
+                        } catch (err) {
+                            setRunner({ status: 'ERROR', company: companyName, error: "Report generated but could not be loaded." });
                         }
-                    } catch (err) {
-                        setRunner({ status: 'ERROR', company: companyName, error: "Report generated but could not be loaded." });
                     }
                 }
-            }
             
-            // Handle Backend Error
-            if (data.status === "error") {
-                ws.close();
-                setRunner({ status: 'ERROR', company: companyName, error: data.message || "Audit Aborted." });
+                // Handle Backend Error
+                if (data.status === "error") {
+                    ws.close();
+                    setRunner({ status: 'ERROR', company: companyName, error: data.message || "Audit Aborted." });
+                }
             }
         };
 
@@ -58,68 +58,72 @@ export const AuditProvider = ({ children }) => {
 
       // 3. Listen for Live Updates
       ws.onmessage = async (event) => {
-        const data = JSON.parse(event.data);
-        
-        // Update Progress & Message
-        setRunner(prev => ({
-            ...prev,
-            status: 'PROCESSING',
-            progress: data.progress || prev.progress,
-            progressMsg: data.message || prev.progressMsg
-        }));
+        // Backend batches bursts of updates into a single JSON array frame
+        const payload = JSON.parse(event.data);
+        const messages = Array.isArray(payload) ? payload : [payload];
+
+        for (const data of messages) {
+            // Update Progress & Message
+            setRunner(prev => ({
+                ...prev,
+                status: 'PROCESSING',
+                progress: data.progress || prev.progress,
+                progressMsg: data.message || prev.progressMsg
+            }));
 
-        // 4. Handle Completion
-        if (data.status === 'completed') {
-            ws.close();
-            setRunner(prev => ({ ...prev, progressMsg: 'Finalizing Report...' }));
+            // 4. Handle Completion
+            if (data.status === 'completed') {
+                ws.close();
+                setRunner(prev => ({ ...prev, progressMsg: 'Finalizing Report...' }));
 
-            try {
-                // Fetch the final generated JSON report
-                // We reuse the compare endpoint logic since it fetches by company name
-                const response = await fetch('https://auto-labor-compliance-agent-production.up.railway.app/api/compare', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ companies: [companyName] })
-                });
+                try {
+                    // Fetch the final generated JSON report
+                    // We reuse the compare endpoint logic since it fetches by company name
+                    const response = await fetch('https://auto-labor-compliance-agent-production.up.railway.app/api/compare', {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({ companies: [companyName] })
+                    });
 
-                const resData = await response.json();
+                    const resData = await response.json();
 
-                if (resData.status === 'success' && resData.data.length > 0) {
-                    const finalReport = resData.data[0];
+                    if (resData.status === 'success' && resData.data.length > 0) {
+                        const finalReport = resData.data[0];
                     
-                    // Success: Update Runner and Show Result
+                        // Success: Update Runner and Show Result
+                        setRunner(prev => ({
+                            ...prev,
+                            status: 'COMPLETED',
+                            progress: 100,
+                            result: finalReport,
+                            progressMsg: 'Audit Complete!'
+                        }));
+                        setViewer(finalReport);
+                    } else {
+                        throw new Error("Report generated but could not be retrieved.");
+                    }
+                } catch (err) {
+                    console.error("Fetch Error:", err);
                     setRunner(prev => ({
                         ...prev,
-                        status: 'COMPLETED',
-                        progress: 100,
-                        result: finalReport,
-                        progressMsg: 'Audit Complete!'
+                        status: 'ERROR',
+                        error: "Audit finished, but report fetch failed.",
+                        progressMsg: 'Error'
                     }));
-                    setViewer(finalReport);
-                } else {
-                    throw new Error("Report generated but could not be retrieved.");
                 }
-            } catch (err) {
-                console.error("Fetch Error:", err);
+            }
+
+            // Handle Backend Errors
+            if (data.status === 'error') {
+                ws.close();
                 setRunner(prev => ({
                     ...prev,
                     status: 'ERROR',
-                    error: "Audit finished, but report fetch failed.",
-                    progressMsg: 'Error'
+                    error: data.message || "Unknown Backend Error",
+                    progressMsg: 'Failed'
                 }));
             }
         }
-
-        // Handle Backend Errors
-        if (data.status === 'error') {
-            ws.close();
-            setRunner(prev => ({
-                ...prev,
-                status: 'ERROR',
-                error: data.message || "Unknown Backend Error",
-                progressMsg: 'Failed'
-            }));
-        }
       };
 
       ws.onerror = (err) => {